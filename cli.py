@@ -7,24 +7,67 @@ Provides command line interface to manage constitution configuration and system
 提供命令行接口来管理宪法配置和系统模式。
 """
 
+import os
 import sys
 import argparse
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, NamedTuple, Optional
 
-# Add src to path / 添加src到路径
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+# Heavy modules are imported inside the commands that need them, so that
+# --help and argument errors return without loading YAML/pydantic.
+# 重量级模块在具体命令中才导入，使 --help 和参数错误无需加载YAML/pydantic。
+if TYPE_CHECKING:
+    from src.constitution.loader import ConstitutionLoader
+    from src.app.mode_manager import ModeManager, SystemMode
+    from src.config.loader import ConfigLoader
 
-from colorama import init, Fore, Style
 
-from src.constitution.loader import ConstitutionLoader, ConstitutionLoadError
-from src.constitution.validator import ConstitutionValidator, ValidationError
-from src.app.mode_manager import ModeManager, SystemMode, ModeTransitionError
-from src.app.logging_setup import setup_logging
-from src.config.loader import ConfigLoader
+class _Palette(NamedTuple):
+    """Terminal color codes / 终端颜色代码"""
+    cyan: str = ""
+    red: str = ""
+    green: str = ""
+    yellow: str = ""
+    reset: str = ""
 
-# Initialize colorama / 初始化colorama
-init(autoreset=True)
+
+@lru_cache(maxsize=None)
+def _color() -> _Palette:
+    """
+    Get color codes, initializing colorama on first use / 获取颜色代码，首次使用时初始化colorama
+    
+    When stdout is not a TTY (pipes, CI) colorama is skipped entirely and all
+    codes are empty strings.
+    
+    Returns:
+        _Palette: Color codes
+    """
+    if not sys.stdout.isatty():
+        return _Palette()
+    
+    from colorama import init, Fore, Style
+    
+    init(autoreset=True)
+    return _Palette(Fore.CYAN, Fore.RED, Fore.GREEN, Fore.YELLOW, Style.RESET_ALL)
+
+
+def _system_mode(value: str) -> "SystemMode":
+    """
+    Convert mode string to SystemMode by member name / 按成员名将模式字符串转换为SystemMode
+    
+    Args:
+        value: Mode string, e.g. "SIMULATION"
+        
+    Returns:
+        SystemMode: Mode enum
+        
+    Raises:
+        KeyError: If value is not a mode name
+    """
+    from src.app.mode_manager import SystemMode
+    
+    return SystemMode.__members__[value]
 
 
 class CLI:
@@ -32,30 +75,52 @@ class CLI:
 
     def __init__(self):
         """Initialize CLI / 初始化CLI"""
-        self.config_loader = ConfigLoader()
-        self.constitution_loader: Optional[ConstitutionLoader] = None
-        self.mode_manager: Optional[ModeManager] = None
+        self._config_loader: Optional["ConfigLoader"] = None
+        self.constitution_loader: Optional["ConstitutionLoader"] = None
+        self.mode_manager: Optional["ModeManager"] = None
+
+    @property
+    def config_loader(self) -> "ConfigLoader":
+        """Get config loader, created on first use / 获取配置加载器（首次使用时创建）"""
+        if self._config_loader is None:
+            from src.config.loader import ConfigLoader
+            
+            self._config_loader = ConfigLoader()
+        return self._config_loader
 
     def load_constitution(self, path: Optional[Path] = None) -> bool:
         """
         Load Constitution File / 加载宪法文件
         
         Args:
-            path: Constitution file path
+            path: Constitution file path, default is the configured CONSTITUTION_PATH
             
         Returns:
             bool: Success or not
         """
+        from src.constitution.loader import ConstitutionLoader, ConstitutionLoadError
+        
+        color = _color()
         try:
-            print(f"{Fore.CYAN}Loading constitution file... / 正在加载宪法文件...{Style.RESET_ALL}")
+            print(f"{color.cyan}Loading constitution file... / 正在加载宪法文件...{color.reset}")
             
+            # Default to CONSTITUTION_PATH from runtime config; only the project's own
+            # constitution gets a cache file, never an arbitrary --path
+            # 默认使用运行时配置中的CONSTITUTION_PATH；仅项目自身的宪法写缓存，--path指定的文件不写
+            use_cache = path is None
             if path is None:
-                path = Path("constitution.yaml")
+                # Consult runtime config only when it can set the path, so a plain load
+                # neither warns about a missing .env nor fails on unrelated settings
+                # 仅在运行时配置可能指定路径时读取配置，避免缺少.env时的警告及无关配置导致失败
+                if "CONSTITUTION_PATH" in os.environ or self.config_loader.env_file.exists():
+                    path = self.config_loader.load().resolved_constitution_path
+                else:
+                    path = Path("constitution.yaml")
             
-            self.constitution_loader = ConstitutionLoader(path)
+            self.constitution_loader = ConstitutionLoader(path, use_cache=use_cache)
             constitution = self.constitution_loader.load()
             
-            print(f"{Fore.GREEN}✓ Constitution loaded successfully / 宪法加载成功{Style.RESET_ALL}")
+            print(f"{color.green}✓ Constitution loaded successfully / 宪法加载成功{color.reset}")
             print(f"  Title: {constitution.meta_info.title}")
             print(f"  Concept: {constitution.meta_info.core_concept}")
             print(f"  Path: {path}")
@@ -63,10 +128,10 @@ class CLI:
             return True
             
         except ConstitutionLoadError as e:
-            print(f"{Fore.RED}✗ Constitution load failed: {e} / 宪法加载失败{Style.RESET_ALL}")
+            print(f"{color.red}✗ Constitution load failed: {e} / 宪法加载失败{color.reset}")
             return False
         except Exception as e:
-            print(f"{Fore.RED}✗ Unknown error occurred: {e} / 发生未知错误{Style.RESET_ALL}")
+            print(f"{color.red}✗ Unknown error occurred: {e} / 发生未知错误{color.reset}")
             return False
 
     def validate_constitution(self, strict: bool = False) -> bool:
@@ -79,12 +144,15 @@ class CLI:
         Returns:
             bool: Validation passed or not
         """
+        from src.constitution.validator import ConstitutionValidator, ValidationError
+        
+        color = _color()
         if self.constitution_loader is None:
-            print(f"{Fore.YELLOW}Please load constitution file first / 请先加载宪法文件{Style.RESET_ALL}")
+            print(f"{color.yellow}Please load constitution file first / 请先加载宪法文件{color.reset}")
             return False
         
         try:
-            print(f"{Fore.CYAN}Validating constitution configuration... / 正在验证宪法配置...{Style.RESET_ALL}")
+            print(f"{color.cyan}Validating constitution configuration... / 正在验证宪法配置...{color.reset}")
             
             constitution = self.constitution_loader.constitution
             validator = ConstitutionValidator(constitution)
@@ -93,52 +161,52 @@ class CLI:
             report = validator.get_validation_report()
             
             if result:
-                print(f"{Fore.GREEN}✓ Constitution validation passed / 宪法验证通过{Style.RESET_ALL}")
+                print(f"{color.green}✓ Constitution validation passed / 宪法验证通过{color.reset}")
             else:
-                print(f"{Fore.RED}✗ Constitution validation failed / 宪法验证失败{Style.RESET_ALL}")
+                print(f"{color.red}✗ Constitution validation failed / 宪法验证失败{color.reset}")
             
             # Show errors / 显示错误
             if report["errors"]:
-                print(f"\n{Fore.RED}Errors ({report['error_count']}): / 错误 ({report['error_count']}个):{Style.RESET_ALL}")
+                print(f"\n{color.red}Errors ({report['error_count']}): / 错误 ({report['error_count']}个):{color.reset}")
                 for i, error in enumerate(report["errors"], 1):
                     print(f"  {i}. {error}")
             
             # Show warnings / 显示警告
             if report["warnings"]:
-                print(f"\n{Fore.YELLOW}Warnings ({report['warning_count']}): / 警告 ({report['warning_count']}个):{Style.RESET_ALL}")
+                print(f"\n{color.yellow}Warnings ({report['warning_count']}): / 警告 ({report['warning_count']}个):{color.reset}")
                 for i, warning in enumerate(report["warnings"], 1):
                     print(f"  {i}. {warning}")
             
             return result
             
         except ValidationError as e:
-            print(f"{Fore.RED}✗ Validation failed: {e} / 验证失败{Style.RESET_ALL}")
+            print(f"{color.red}✗ Validation failed: {e} / 验证失败{color.reset}")
             return False
         except Exception as e:
-            print(f"{Fore.RED}✗ Unknown error occurred: {e} / 发生未知错误{Style.RESET_ALL}")
+            print(f"{color.red}✗ Unknown error occurred: {e} / 发生未知错误{color.reset}")
             return False
 
     def show_mode(self) -> None:
         """Show Current System Mode / 显示当前系统模式"""
+        from src.app.mode_manager import MODE_DESCRIPTIONS
+        
+        color = _color()
         if self.mode_manager is None:
             # Read from config / 从配置读取
             try:
                 config = self.config_loader.load()
                 current_mode = config.system_mode
-                print(f"{Fore.CYAN}Current System Mode: / 当前系统模式:{Style.RESET_ALL} {current_mode}")
+                print(f"{color.cyan}Current System Mode: / 当前系统模式:{color.reset} {current_mode}")
                 
                 # Show mode description / 显示模式描述
-                mode_enum = SystemMode(current_mode)
-                manager = ModeManager(initial_mode=mode_enum)
-                desc = manager.get_mode_description()
-                print(f"  {desc}")
+                print(f"  {MODE_DESCRIPTIONS[_system_mode(current_mode)]}")
             except Exception as e:
-                print(f"{Fore.RED}Failed to read system mode: {e} / 无法读取系统模式{Style.RESET_ALL}")
+                print(f"{color.red}Failed to read system mode: {e} / 无法读取系统模式{color.reset}")
         else:
             mode = self.mode_manager.current_mode
             desc = self.mode_manager.get_mode_description()
             
-            print(f"{Fore.CYAN}Current System Mode: / 当前系统模式:{Style.RESET_ALL} {mode.value}")
+            print(f"{color.cyan}Current System Mode: / 当前系统模式:{color.reset} {mode.value}")
             print(f"  {desc}")
             
             if self.mode_manager.previous_mode:
@@ -156,16 +224,20 @@ class CLI:
         Returns:
             bool: Success or not
         """
+        from src.app.mode_manager import ModeManager, SystemMode, ModeTransitionError
+        from src.app.logging_setup import setup_logging
+        
+        color = _color()
         try:
             # Initialize mode_manager / 初始化mode_manager
             if self.mode_manager is None:
                 config = self.config_loader.load()
-                current_mode = SystemMode(config.system_mode)
+                current_mode = _system_mode(config.system_mode)
                 
                 # Setup logging / 设置日志
                 audit_logger = setup_logging(
                     log_level=config.log_level,
-                    log_dir=config.log_dir,
+                    log_dir=config.resolved_log_dir,
                     enable_console=False
                 )
                 
@@ -174,9 +246,9 @@ class CLI:
                     audit_logger=audit_logger
                 )
             
-            target = SystemMode(target_mode)
+            target = _system_mode(target_mode)
             
-            print(f"{Fore.CYAN}Switching mode... / 正在切换模式...{Style.RESET_ALL}")
+            print(f"{color.cyan}Switching mode... / 正在切换模式...{color.reset}")
             print(f"  From: {self.mode_manager.current_mode.value}")
             print(f"  To: {target.value}")
             if reason:
@@ -184,149 +256,220 @@ class CLI:
             
             # If LIVE mode and requires confirmation / 如果是LIVE模式且需要确认
             if target == SystemMode.LIVE and not force:
-                print(f"\n{Fore.YELLOW}⚠️  WARNING: About to switch to LIVE mode! / 警告: 即将切换到实盘模式 (LIVE)！{Style.RESET_ALL}")
+                print(f"\n{color.yellow}⚠️  WARNING: About to switch to LIVE mode! / 警告: 即将切换到实盘模式 (LIVE)！{color.reset}")
                 print("This will allow the system to execute real trades. / 这将允许系统进行真实交易。")
                 response = input("Confirm switch? (Type 'YES' to continue): / 是否确认切换？(输入 'YES' 继续): ")
                 
                 if response != "YES":
-                    print(f"{Fore.YELLOW}Switch cancelled / 已取消切换{Style.RESET_ALL}")
+                    print(f"{color.yellow}Switch cancelled / 已取消切换{color.reset}")
                     return False
                 
                 force = True
             
             self.mode_manager.switch_mode(target, reason=reason, force=force)
             
-            print(f"{Fore.GREEN}✓ Mode switch successful / 模式切换成功{Style.RESET_ALL}")
+            print(f"{color.green}✓ Mode switch successful / 模式切换成功{color.reset}")
             print(f"  Current Mode: {self.mode_manager.current_mode.value}")
             
             return True
             
-        except ValueError as e:
-            print(f"{Fore.RED}✗ Invalid mode: {target_mode} / 无效的模式{Style.RESET_ALL}")
+        except KeyError:
+            print(f"{color.red}✗ Invalid mode: {target_mode} / 无效的模式{color.reset}")
             print(f"  Available modes: SIMULATION, DRY_RUN, LIVE, EMERGENCY")
             return False
         except ModeTransitionError as e:
-            print(f"{Fore.RED}✗ Mode switch failed: {e} / 模式切换失败{Style.RESET_ALL}")
+            print(f"{color.red}✗ Mode switch failed: {e} / 模式切换失败{color.reset}")
             return False
         except Exception as e:
-            print(f"{Fore.RED}✗ Unknown error occurred: {e} / 发生未知错误{Style.RESET_ALL}")
+            print(f"{color.red}✗ Unknown error occurred: {e} / 发生未知错误{color.reset}")
             return False
 
     def show_risk_limits(self) -> None:
         """Show Risk Limits / 显示风险限制"""
+        color = _color()
         if self.constitution_loader is None:
-            print(f"{Fore.YELLOW}Please load constitution file first / 请先加载宪法文件{Style.RESET_ALL}")
+            print(f"{color.yellow}Please load constitution file first / 请先加载宪法文件{color.reset}")
             return
         
         try:
             limits = self.constitution_loader.get_risk_limits()
             
-            print(f"{Fore.CYAN}Risk Limits Configuration: / 风险限制配置:{Style.RESET_ALL}")
-            print(f"  Max Capital Usage: {limits['max_capital_usage']:.1%} / 最大资金使用比率")
-            print(f"  Max Single Position: {limits['max_single_position']:.1%} / 单一头寸上限")
-            print(f"  Max Sector Exposure: {limits['max_sector_exposure']:.1%} / 单一行业暴露上限")
-            print(f"  Max Drawdown Limit: {limits['max_drawdown']:.1%} / 最大回撤限制")
+            # Write all lines at once / 一次性输出所有行
+            lines = [
+                f"{color.cyan}Risk Limits Configuration: / 风险限制配置:{color.reset}",
+                f"  Max Capital Usage: {limits['max_capital_usage']:.1%} / 最大资金使用比率",
+                f"  Max Single Position: {limits['max_single_position']:.1%} / 单一头寸上限",
+                f"  Max Sector Exposure: {limits['max_sector_exposure']:.1%} / 单一行业暴露上限",
+                f"  Max Drawdown Limit: {limits['max_drawdown']:.1%} / 最大回撤限制",
+            ]
+            sys.stdout.write("\n".join(lines) + "\n")
             
         except Exception as e:
-            print(f"{Fore.RED}✗ Failed to read risk limits: {e} / 读取风险限制失败{Style.RESET_ALL}")
+            print(f"{color.red}✗ Failed to read risk limits: {e} / 读取风险限制失败{color.reset}")
 
     def show_market_states(self) -> None:
         """Show Market States Configuration / 显示市场状态配置"""
+        color = _color()
         if self.constitution_loader is None:
-            print(f"{Fore.YELLOW}Please load constitution file first / 请先加载宪法文件{Style.RESET_ALL}")
+            print(f"{color.yellow}Please load constitution file first / 请先加载宪法文件{color.reset}")
             return
         
         try:
             states = ["normal_market", "cautious_market", "dangerous_market"]
             
-            print(f"{Fore.CYAN}Market State Configuration: / 市场状态配置:{Style.RESET_ALL}\n")
+            # Collect output and write once / 收集输出后一次性写出
+            lines = [f"{color.cyan}Market State Configuration: / 市场状态配置:{color.reset}\n"]
             
             for state in states:
                 params = self.constitution_loader.get_market_state_parameters(state)
                 if params:
-                    print(f"  【{state}】")
-                    print(f"    Max Capital Usage: {params['max_capital_usage']:.1%} / 最大资金使用比率")
-                    print(f"    Max Single Position: {params['max_single_position']:.1%} / 单一头寸上限")
-                    print(f"    Safety Margin: {params['safety_margin_requirement']} / 安全边际要求")
+                    lines.append(f"  【{state}】")
+                    lines.append(f"    Max Capital Usage: {params['max_capital_usage']:.1%} / 最大资金使用比率")
+                    lines.append(f"    Max Single Position: {params['max_single_position']:.1%} / 单一头寸上限")
+                    lines.append(f"    Safety Margin: {params['safety_margin_requirement']} / 安全边际要求")
                     if params.get('min_cash_ratio'):
-                        print(f"    Min Cash Ratio: {params['min_cash_ratio']:.1%} / 现金比例下限")
-                    print()
+                        lines.append(f"    Min Cash Ratio: {params['min_cash_ratio']:.1%} / 现金比例下限")
+                    lines.append("")
+            
+            sys.stdout.write("\n".join(lines) + "\n")
             
         except Exception as e:
-            print(f"{Fore.RED}✗ Failed to read market state configuration: {e} / 读取市场状态配置失败{Style.RESET_ALL}")
+            print(f"{color.red}✗ Failed to read market state configuration: {e} / 读取市场状态配置失败{color.reset}")
 
 
-def main():
-    """Main Function / 主函数"""
-    parser = argparse.ArgumentParser(
-        description="Uniscanner CLI - Constitution Management and System Control Tool / 宪法管理和系统控制工具",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
-    
-    subparsers = parser.add_subparsers(dest="command", help="Available Commands / 可用命令")
-    
-    # load command
-    load_parser = subparsers.add_parser("load", help="Load Constitution File / 加载宪法文件")
-    load_parser.add_argument(
+def _add_load_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add load command arguments / 添加load命令参数"""
+    parser.add_argument(
         "--path", "-p",
         type=Path,
-        help="Constitution file path (default: constitution.yaml) / 宪法文件路径"
+        help="Constitution file path (default: CONSTITUTION_PATH, else constitution.yaml) / 宪法文件路径"
     )
-    
-    # validate command
-    validate_parser = subparsers.add_parser("validate", help="Validate Constitution Configuration / 验证宪法配置")
-    validate_parser.add_argument(
+
+
+def _add_validate_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add validate command arguments / 添加validate命令参数"""
+    parser.add_argument(
         "--path", "-p",
         type=Path,
-        help="Constitution file path (default: constitution.yaml) / 宪法文件路径"
+        help="Constitution file path (default: CONSTITUTION_PATH, else constitution.yaml) / 宪法文件路径"
     )
-    validate_parser.add_argument(
+    parser.add_argument(
         "--strict", "-s",
         action="store_true",
         help="Strict mode (warnings count as failure) / 严格模式"
     )
-    
-    # mode command
-    mode_parser = subparsers.add_parser("mode", help="View or Switch System Mode / 查看或切换系统模式")
-    mode_parser.add_argument(
+
+
+def _add_mode_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add mode command arguments / 添加mode命令参数"""
+    parser.add_argument(
         "--switch", "-s",
         type=str,
         choices=["SIMULATION", "DRY_RUN", "LIVE", "EMERGENCY"],
         help="Switch to specified mode / 切换到指定模式"
     )
-    mode_parser.add_argument(
+    parser.add_argument(
         "--reason", "-r",
         type=str,
         default="",
         help="Switch reason / 切换原因"
     )
-    mode_parser.add_argument(
+    parser.add_argument(
         "--force", "-f",
         action="store_true",
         help="Force switch (skip confirmation) / 强制切换"
     )
-    
-    # info command
-    info_parser = subparsers.add_parser("info", help="Show Constitution Info / 显示宪法信息")
-    info_parser.add_argument(
+
+
+def _add_info_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add info command arguments / 添加info命令参数"""
+    parser.add_argument(
         "--path", "-p",
         type=Path,
-        help="Constitution file path (default: constitution.yaml) / 宪法文件路径"
+        help="Constitution file path (default: CONSTITUTION_PATH, else constitution.yaml) / 宪法文件路径"
     )
-    info_parser.add_argument(
+    parser.add_argument(
         "--type", "-t",
         type=str,
         choices=["risk", "market"],
         default="risk",
         help="Info type: risk (Risk Limits), market (Market States) / 信息类型"
     )
+
+
+# Subcommand name -> (help, argument builder) / 子命令 -> (帮助, 参数构建函数)
+_COMMANDS = {
+    "load": ("Load Constitution File / 加载宪法文件", _add_load_arguments),
+    "validate": ("Validate Constitution Configuration / 验证宪法配置", _add_validate_arguments),
+    "mode": ("View or Switch System Mode / 查看或切换系统模式", _add_mode_arguments),
+    "info": ("Show Constitution Info / 显示宪法信息", _add_info_arguments),
+}
+
+
+def _build_parser(with_arguments: bool = True) -> argparse.ArgumentParser:
+    """
+    Build full parser with all subcommands / 构建包含所有子命令的完整解析器
     
-    args = parser.parse_args()
+    Args:
+        with_arguments: Whether to add subcommand arguments; the top-level
+            help only lists subcommand names, so it can skip them
+    
+    Returns:
+        argparse.ArgumentParser: Top-level parser
+    """
+    parser = argparse.ArgumentParser(
+        description="Uniscanner CLI - Constitution Management and System Control Tool / 宪法管理和系统控制工具",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
     
-    if not args.command:
-        parser.print_help()
+    subparsers = parser.add_subparsers(dest="command", help="Available Commands / 可用命令")
+    for command, (help_text, add_arguments) in _COMMANDS.items():
+        command_parser = subparsers.add_parser(command, help=help_text)
+        if with_arguments:
+            add_arguments(command_parser)
+    
+    return parser
+
+
+def _build_command_parser(command: str) -> argparse.ArgumentParser:
+    """
+    Build standalone parser for a single subcommand / 为单个子命令构建独立解析器
+    
+    Args:
+        command: Subcommand name
+        
+    Returns:
+        argparse.ArgumentParser: Parser equivalent to the subcommand's subparser
+    """
+    _, add_arguments = _COMMANDS[command]
+    parser = argparse.ArgumentParser(prog=f"{Path(sys.argv[0]).name} {command}")
+    add_arguments(parser)
+    return parser
+
+
+def main():
+    """Main Function / 主函数"""
+    argv = sys.argv[1:]
+    
+    # Top-level help: print and exit before any other work / 顶层帮助：直接输出并返回
+    if not argv or argv[0] in ("-h", "--help"):
+        _build_parser(with_arguments=False).print_help()
         return
     
+    command = argv[0] if argv[0] in _COMMANDS else None
+    
+    # Only build the chosen subcommand; help and unknown input get the full parser
+    # 只构建所选子命令；帮助和未知输入使用完整解析器
+    if command is None:
+        parser = _build_parser()
+        args = parser.parse_args(argv)
+        if not args.command:
+            parser.print_help()
+            return
+    else:
+        args = _build_command_parser(command).parse_args(argv[1:])
+        args.command = command
+    
     cli = CLI()
     
     # Execute command / 执行命令
@@ -2,12 +2,13 @@
 应用核心模块 - 模式管理、日志系统等
 """
 
-from .mode_manager import ModeManager, SystemMode
+from .mode_manager import ModeManager, SystemMode, MODE_DESCRIPTIONS
 from .logging_setup import setup_logging, get_logger
 
 __all__ = [
     "ModeManager",
     "SystemMode",
+    "MODE_DESCRIPTIONS",
     "setup_logging",
     "get_logger",
 ]
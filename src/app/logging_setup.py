@@ -6,34 +6,81 @@ Provides structured logging, audit records, and error tracking.
 提供结构化日志、审计记录和错误追踪功能。
 """
 
+import atexit
 import logging
+import logging.handlers
 import json
+import queue
 import sys
+import threading
+import time
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
-from enum import Enum
+from typing import Any, Dict, Final, Optional
 
+try:
+    import orjson
+except ImportError:  # Optional dependency / 可选依赖
+    orjson = None
 
-class LogLevel(str, Enum):
-    """Log Level / 日志级别"""
-    DEBUG = "DEBUG"
-    INFO = "INFO"
-    WARNING = "WARNING"
-    ERROR = "ERROR"
-    CRITICAL = "CRITICAL"
+_UTC = timezone.utc
 
+# Compact separators, the same layout orjson writes / 紧凑分隔符，与orjson输出格式一致
+_JSON_SEPARATORS = (",", ":")
 
-class AuditEventType(str, Enum):
-    """Audit Event Type / 审计事件类型"""
-    CONSTITUTION_LOADED = "constitution_loaded"
-    CONSTITUTION_VALIDATION_FAILED = "constitution_validation_failed"
-    MODE_SWITCHED = "mode_switched"
-    MODE_SWITCH_DENIED = "mode_switch_denied"
-    EMERGENCY_TRIGGERED = "emergency_triggered"
-    RISK_LIMIT_VIOLATED = "risk_limit_violated"
-    SYSTEM_STARTED = "system_started"
-    SYSTEM_STOPPED = "system_stopped"
+
+if orjson is not None:
+    def _dumps(data: Dict[str, Any]) -> str:
+        """
+        Serialize to JSON via orjson (UTF-8 native) / 使用orjson序列化JSON
+        
+        orjson rejects non-str keys and types it does not know; those records
+        fall back to stdlib json with the same compact layout. orjson writes
+        NaN/Infinity as null where stdlib json writes NaN/Infinity.
+        orjson拒绝非字符串键和未知类型，此时回退到标准库json（同样紧凑格式）。orjson将NaN/Infinity写为null。
+        """
+        try:
+            return orjson.dumps(data).decode("utf-8")
+        except TypeError:  # orjson.JSONEncodeError subclasses TypeError
+            return json.dumps(data, ensure_ascii=False, separators=_JSON_SEPARATORS)
+else:
+    def _dumps(data: Dict[str, Any]) -> str:
+        """Serialize to compact JSON via stdlib json / 使用标准库json序列化为紧凑JSON"""
+        return json.dumps(data, ensure_ascii=False, separators=_JSON_SEPARATORS)
+
+
+class LogLevel:
+    """Log Level, plain string constants / 日志级别（纯字符串常量）"""
+    DEBUG: Final = "DEBUG"
+    INFO: Final = "INFO"
+    WARNING: Final = "WARNING"
+    ERROR: Final = "ERROR"
+    CRITICAL: Final = "CRITICAL"
+
+    ALL: Final = frozenset({DEBUG, INFO, WARNING, ERROR, CRITICAL})
+
+
+class AuditEventType:
+    """Audit Event Type, plain string constants / 审计事件类型（纯字符串常量）"""
+    CONSTITUTION_LOADED: Final = "constitution_loaded"
+    CONSTITUTION_VALIDATION_FAILED: Final = "constitution_validation_failed"
+    MODE_SWITCHED: Final = "mode_switched"
+    MODE_SWITCH_DENIED: Final = "mode_switch_denied"
+    EMERGENCY_TRIGGERED: Final = "emergency_triggered"
+    RISK_LIMIT_VIOLATED: Final = "risk_limit_violated"
+    SYSTEM_STARTED: Final = "system_started"
+    SYSTEM_STOPPED: Final = "system_stopped"
+
+    ALL: Final = frozenset({
+        CONSTITUTION_LOADED,
+        CONSTITUTION_VALIDATION_FAILED,
+        MODE_SWITCHED,
+        MODE_SWITCH_DENIED,
+        EMERGENCY_TRIGGERED,
+        RISK_LIMIT_VIOLATED,
+        SYSTEM_STARTED,
+        SYSTEM_STOPPED,
+    })
 
 
 class StructuredFormatter(logging.Formatter):
@@ -42,45 +89,226 @@ class StructuredFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON / 格式化日志记录为JSON"""
         log_data = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            # Use the record's creation time instead of a second clock read / 使用记录创建时间，避免再次读取时钟
+            "timestamp": datetime.fromtimestamp(record.created, _UTC).isoformat(timespec="milliseconds"),
             "level": record.levelname,
             "logger": record.name,
-            "message": record.getMessage(),
+            # Skip %-formatting for preformatted messages / 预格式化消息跳过%格式化
+            "message": record.getMessage() if record.args else str(record.msg),
             "module": record.module,
             "function": record.funcName,
             "line": record.lineno,
         }
 
         # Add extra fields / 添加额外字段
-        if hasattr(record, "extra_data"):
-            log_data["extra"] = record.extra_data
+        extra = record.__dict__.get("extra_data")
+        if extra is not None:
+            log_data["extra"] = extra
 
         # Add exception info / 添加异常信息
-        if record.exc_info:
+        exc_info = record.exc_info
+        if exc_info:
+            exc_type, exc_value, _ = exc_info
             log_data["exception"] = {
-                "type": record.exc_info[0].__name__ if record.exc_info[0] else None,
-                "message": str(record.exc_info[1]) if record.exc_info[1] else None,
-                "traceback": self.formatException(record.exc_info),
+                "type": exc_type.__name__ if exc_type else None,
+                "message": str(exc_value) if exc_value else None,
+                "traceback": self.formatException(exc_info),
             }
 
-        return json.dumps(log_data, ensure_ascii=False)
+        return _dumps(log_data)
+
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler for in-process listeners / 进程内队列处理器
+    
+    Unlike the stdlib QueueHandler it keeps exc_info on the record, so the
+    listener's StructuredFormatter can still emit the "exception" field.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge args at log time, keep record otherwise intact / 记录时合并参数，其他保持不变"""
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Block when a bounded queue is full instead of dropping / 有界队列已满时阻塞而非丢弃"""
+        self.queue.put(record)
+
+
+class _FormattingQueueHandler(_InProcessQueueHandler):
+    """
+    Queue handler that formats on the caller thread / 在调用线程格式化的队列处理器
+    
+    Like the stdlib QueueHandler the record is formatted at log time, so later
+    changes to objects passed in extra (e.g. a history record) cannot alter
+    what is written. The queue receives the formatted line.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> str:
+        """Format record to its final line / 将记录格式化为最终文本行"""
+        return self.format(record)
+
+    def enqueue(self, line: str) -> None:
+        """Block when a bounded queue is full instead of dropping / 有界队列已满时阻塞而非丢弃"""
+        self.queue.put(line)
+
+
+class _BatchWriter:
+    """
+    Background batched file writer / 后台批量文件写入器
+    
+    Drains a queue of formatted lines and writes them with a single write()+flush()
+    once batch_max_size lines are collected or batch_max_wait seconds have
+    passed since the first line of the batch.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        path: Path,
+        log_queue: queue.Queue,
+        batch_max_size: int,
+        batch_max_wait: float,
+    ):
+        """
+        Initialize and start the writer thread / 初始化并启动写入线程
+        
+        Args:
+            path: File to append to
+            log_queue: Queue fed by a _FormattingQueueHandler
+            batch_max_size: Max lines per write
+            batch_max_wait: Max seconds a line waits before being written
+        """
+        self._stream = open(path, "a", encoding="utf-8")
+        self._queue = log_queue
+        self._batch_max_size = batch_max_size
+        self._batch_max_wait = batch_max_wait
+        self._thread = threading.Thread(target=self._run, name="audit-batch-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Writer loop / 写入循环"""
+        while True:
+            item = self._queue.get()
+            batch = []
+            deadline = time.monotonic() + self._batch_max_wait
+            # Collect until size/wait threshold or a control item / 收集直到达到数量/时间阈值或遇到控制项
+            while isinstance(item, str):
+                batch.append(item)
+                if len(batch) >= self._batch_max_size:
+                    item = None
+                    break
+                timeout = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    item = None
+            
+            self._write(batch)
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is self._STOP:
+                return
+
+    def _write(self, batch: list) -> None:
+        """Write one batch / 写入一批记录"""
+        if not batch:
+            return
+        try:
+            self._stream.write("\n".join(batch) + "\n")
+            self._stream.flush()
+        except Exception as e:
+            sys.stderr.write(f"Failed to write audit batch / 审计批量写入失败: {e}\n")
+
+    def flush(self) -> None:
+        """Block until all queued records are written / 阻塞直到所有排队记录写入"""
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def stop(self) -> None:
+        """Write remaining records, stop the thread and close the file / 写入剩余记录，停止线程并关闭文件"""
+        self._queue.put(self._STOP)
+        self._thread.join()
+        self._stream.close()
+
+
+def _queue_handler_for(handler: logging.Handler) -> tuple:
+    """
+    Move a handler's I/O onto a background listener thread / 将处理器I/O移至后台监听线程
+    
+    Args:
+        handler: Handler doing the actual (blocking) write
+        
+    Returns:
+        tuple: (QueueHandler to attach to loggers, started QueueListener)
+    """
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    return _InProcessQueueHandler(log_queue), listener
+
+
+# Listener serving the root file handler / 根logger文件处理器的监听器
+_root_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_root_listener() -> None:
+    """Flush and stop the root file listener / 刷新并停止根文件监听器"""
+    global _root_listener
+    if _root_listener is not None:
+        _root_listener.stop()
+        for handler in _root_listener.handlers:
+            handler.close()
+        _root_listener = None
+
+
+atexit.register(_stop_root_listener)
+
+# Result of the last setup_logging call / 上一次setup_logging调用的结果
+_audit_logger: Optional["AuditLogger"] = None
+_setup_args: Optional[tuple] = None
 
 
 class AuditLogger:
     """Audit Logger / 审计日志记录器"""
 
-    def __init__(self, log_dir: Path):
+    def __init__(
+        self,
+        log_dir: Path,
+        date_tag: Optional[str] = None,
+        mode: str = "blocking",
+        batch_max_size: int = 100,
+        batch_max_wait: float = 1.0,
+        queue_maxsize: int = 10_000,
+    ):
         """
         Initialize Audit Logger / 初始化审计日志记录器
         
         Args:
             log_dir: Log directory
+            date_tag: Date part of the file name (YYYYMMDD), default is today
+            mode: "blocking" writes on the caller thread, "batch" writes from a background
+                thread in batches (pending events are lost if the process is killed)
+            batch_max_size: Batch mode, max events per write
+            batch_max_wait: Batch mode, max seconds an event waits before being written
+            queue_maxsize: Batch mode, max pending events before log_event blocks
         """
+        if mode not in ("batch", "blocking"):
+            raise ValueError(f"Unknown audit logger mode: {mode} / 未知的审计日志模式")
+        
         self.log_dir = log_dir
         self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.mode = mode
         
         # Create audit log file / 创建审计日志文件
-        audit_file = self.log_dir / f"audit_{datetime.now().strftime('%Y%m%d')}.jsonl"
+        if date_tag is None:
+            date_tag = datetime.now().strftime('%Y%m%d')
+        audit_file = self.log_dir / f"audit_{date_tag}.jsonl"
         self.audit_file = audit_file
         
         # Configure audit logger / 配置审计logger
@@ -88,14 +316,47 @@ class AuditLogger:
         self.logger.setLevel(logging.INFO)
         self.logger.propagate = False
         
-        # File handler / 文件处理器
-        file_handler = logging.FileHandler(audit_file, encoding="utf-8")
-        file_handler.setFormatter(StructuredFormatter())
-        self.logger.addHandler(file_handler)
+        self._batch_writer: Optional[_BatchWriter] = None
+        if mode == "batch":
+            # Events are formatted on enqueue and written in batches / 事件入队时格式化，随后批量写入
+            log_queue = queue.Queue(maxsize=queue_maxsize)
+            self._batch_writer = _BatchWriter(audit_file, log_queue, batch_max_size, batch_max_wait)
+            self._handler: logging.Handler = _FormattingQueueHandler(log_queue)
+            self._handler.setFormatter(StructuredFormatter())
+        else:
+            # File handler / 文件处理器
+            self._handler = logging.FileHandler(audit_file, encoding="utf-8")
+            self._handler.setFormatter(StructuredFormatter())
+        self.logger.addHandler(self._handler)
+        self._closed = False
+        atexit.register(self.close)
+
+    def flush(self) -> None:
+        """
+        Write all pending events to the audit file / 将所有待写事件写入审计文件
+        """
+        if self._closed:
+            return
+        if self._batch_writer is not None:
+            self._batch_writer.flush()
+        else:
+            self._handler.flush()
+
+    def close(self) -> None:
+        """
+        Flush pending events and release the audit file / 刷新待写事件并释放审计文件
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self.logger.removeHandler(self._handler)
+        if self._batch_writer is not None:
+            self._batch_writer.stop()
+        self._handler.close()
 
     def log_event(
         self,
-        event_type: AuditEventType,
+        event_type: str,
         message: str,
         details: Optional[Dict[str, Any]] = None,
         user: Optional[str] = None,
@@ -104,13 +365,13 @@ class AuditLogger:
         Record Audit Event / 记录审计事件
         
         Args:
-            event_type: Event type
+            event_type: Event type, one of AuditEventType
             message: Event message
             details: Event details
             user: Operating user
         """
         audit_data = {
-            "event_type": event_type.value,
+            "event_type": event_type,
             "message": message,
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
@@ -123,7 +384,7 @@ class AuditLogger:
         
         # Use extra param to pass structured data / 使用extra参数传递结构化数据
         self.logger.info(
-            f"[AUDIT] {event_type.value}: {message}",
+            f"[AUDIT] {event_type}: {message}",
             extra={"extra_data": audit_data}
         )
 
@@ -146,22 +407,35 @@ def setup_logging(
     Returns:
         AuditLogger: Audit logger instance
     """
+    global _root_listener, _audit_logger, _setup_args
+    
     # Set log directory / 设置日志目录
     if log_dir is None:
         log_dir = Path("logs")
+    
+    # Already configured with the same arguments / 已使用相同参数配置
+    setup_args = (log_level, log_dir, enable_console, enable_file)
+    if _audit_logger is not None and setup_args == _setup_args:
+        return _audit_logger
+    
     log_dir.mkdir(parents=True, exist_ok=True)
+    date_tag = datetime.now().strftime('%Y%m%d')
     
     # Configure root logger / 配置根logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, log_level.upper()))
+    level = getattr(logging, log_level.upper())
+    root_logger.setLevel(level)
     
     # Clear existing handlers / 清除现有处理器
     root_logger.handlers.clear()
+    _stop_root_listener()
+    if _audit_logger is not None:
+        _audit_logger.close()
     
     # Console handler (Human readable) / 控制台处理器（人类可读格式）
     if enable_console:
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(getattr(logging, log_level.upper()))
+        console_handler.setLevel(level)
         console_format = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S"
@@ -171,14 +445,17 @@ def setup_logging(
     
     # File handler (Structured JSON) / 文件处理器（结构化JSON格式）
     if enable_file:
-        log_file = log_dir / f"app_{datetime.now().strftime('%Y%m%d')}.log"
+        log_file = log_dir / f"app_{date_tag}.log"
         file_handler = logging.FileHandler(log_file, encoding="utf-8")
-        file_handler.setLevel(logging.DEBUG)  # Log all levels to file / 文件记录所有级别
+        # The root logger filters by log_level before handlers run, so the file
+        # receives the same levels as the console / 根logger先按log_level过滤，文件与控制台级别一致
+        file_handler.setLevel(level)
         file_handler.setFormatter(StructuredFormatter())
-        root_logger.addHandler(file_handler)
+        queue_handler, _root_listener = _queue_handler_for(file_handler)
+        root_logger.addHandler(queue_handler)
     
     # Create audit logger / 创建审计日志记录器
-    audit_logger = AuditLogger(log_dir)
+    audit_logger = AuditLogger(log_dir, date_tag=date_tag)
     
     # Record system start / 记录系统启动
     audit_logger.log_event(
@@ -187,6 +464,8 @@ def setup_logging(
         details={"log_level": log_level, "log_dir": str(log_dir)}
     )
     
+    _audit_logger = audit_logger
+    _setup_args = setup_args
     return audit_logger
 
 
@@ -7,8 +7,9 @@ Manage the state machine of system operation modes, ensuring safety and traceabi
 """
 
 import logging
-from enum import Enum
-from typing import Optional
+from collections import deque
+from enum import Enum, IntFlag
+from typing import Iterator, Optional
 from datetime import datetime, timezone
 
 from .logging_setup import AuditLogger, AuditEventType
@@ -24,6 +25,54 @@ class SystemMode(str, Enum):
     EMERGENCY = "EMERGENCY"
 
 
+class _ModeBit(IntFlag):
+    """One bit per SystemMode, for mask-based state checks / 每个模式一个位，用于掩码检查"""
+    SIMULATION = 1
+    DRY_RUN = 2
+    LIVE = 4
+    EMERGENCY = 8
+
+
+# Plain ints so checks are a single integer AND / 使用纯整数，检查只需一次按位与
+_MODE_BITS = {mode: int(_ModeBit[mode.name]) for mode in SystemMode}
+_SIMULATION_BIT = _MODE_BITS[SystemMode.SIMULATION]
+_DRY_RUN_BIT = _MODE_BITS[SystemMode.DRY_RUN]
+_LIVE_BIT = _MODE_BITS[SystemMode.LIVE]
+_EMERGENCY_BIT = _MODE_BITS[SystemMode.EMERGENCY]
+_TRADE_MASK = int(_ModeBit.LIVE)
+_ANALYZE_MASK = int(_ModeBit.SIMULATION | _ModeBit.DRY_RUN | _ModeBit.LIVE)
+
+# Ordinal per mode, used to index the adjacency matrix / 模式序号，用于索引邻接矩阵
+_MODE_COUNT = len(SystemMode)
+_MODE_ORD = {mode: i for i, mode in enumerate(SystemMode)}
+
+
+def _adjacency_matrix(transitions: dict) -> bytes:
+    """
+    Build a flat mode x mode transition matrix / 构建扁平的模式转换矩阵
+    
+    Args:
+        transitions: Mapping of source mode to allowed target modes
+        
+    Returns:
+        bytes: 1 at [source_ord * mode_count + target_ord] for allowed transitions, else 0
+    """
+    table = bytearray(_MODE_COUNT * _MODE_COUNT)
+    for source, targets in transitions.items():
+        for target in targets:
+            table[_MODE_ORD[source] * _MODE_COUNT + _MODE_ORD[target]] = 1
+    return bytes(table)
+
+
+# Mode descriptions, built once at import / 模式描述（导入时构建一次）
+MODE_DESCRIPTIONS = {
+    SystemMode.SIMULATION: "Simulation Mode - Replay/Backtest, No Broker Connection / 仿真模式 - 回放/回测，不连券商",
+    SystemMode.DRY_RUN: "Dry Run Mode - Connected to Market, No Real Orders / 影子模式 - 连行情，不下真实单",
+    SystemMode.LIVE: "Live Mode - Automated Trading / 实盘模式 - 自动交易",
+    SystemMode.EMERGENCY: "Emergency Mode - Only Reduce/Clear Positions, No New Positions / 紧急模式 - 只允许减仓或清仓，禁止新增仓位",
+}
+
+
 class ModeTransitionError(Exception):
     """Mode Transition Error / 模式切换错误"""
     pass
@@ -32,19 +81,69 @@ class ModeTransitionError(Exception):
 class ModeManager:
     """Mode Manager - Implements 3-state (+Emergency) State Machine / 模式管理器 - 实现三态（+紧急态）状态机"""
 
+    __slots__ = (
+        "_current_mode",
+        "_current_mode_bit",
+        "_previous_mode",
+        "_mode_history",
+        "_audit_logger",
+        "_require_confirmation_for_live",
+    )
+
     # Define allowed transitions / 定义允许的状态转换
     ALLOWED_TRANSITIONS = {
-        SystemMode.SIMULATION: [SystemMode.DRY_RUN],
-        SystemMode.DRY_RUN: [SystemMode.SIMULATION, SystemMode.LIVE, SystemMode.EMERGENCY],
-        SystemMode.LIVE: [SystemMode.DRY_RUN, SystemMode.EMERGENCY],
-        SystemMode.EMERGENCY: [SystemMode.DRY_RUN],
+        SystemMode.SIMULATION: frozenset({SystemMode.DRY_RUN}),
+        SystemMode.DRY_RUN: frozenset({SystemMode.SIMULATION, SystemMode.LIVE, SystemMode.EMERGENCY}),
+        SystemMode.LIVE: frozenset({SystemMode.DRY_RUN, SystemMode.EMERGENCY}),
+        SystemMode.EMERGENCY: frozenset({SystemMode.DRY_RUN}),
+    }
+
+    # 4x4 adjacency matrix indexed by ordinals; the dict above is kept for messages / 按序号索引的4x4邻接矩阵，上面的字典仅用于信息展示
+    _ORD = _MODE_ORD
+    _TABLE = _adjacency_matrix(ALLOWED_TRANSITIONS)
+
+    # Mode descriptions, shared with module-level MODE_DESCRIPTIONS / 模式描述
+    _DESCRIPTIONS = MODE_DESCRIPTIONS
+
+    # Allowed target values in declaration order, for error messages / 允许的目标模式值（用于错误信息）
+    _ALLOWED_VALUES = {
+        mode: tuple(target.value for target in SystemMode if target in targets)
+        for mode, targets in ALLOWED_TRANSITIONS.items()
     }
 
+    @staticmethod
+    def _fmt_denied(current: SystemMode, target: SystemMode, allowed: tuple, reason: str):
+        """Format a denied switch as (message, details) / 格式化被拒绝的切换"""
+        msg = (
+            f"Transition from {current.value} to {target.value} is not allowed. "
+            f"Allowed transitions: {list(allowed)}"
+        )
+        return msg, {
+            "current_mode": current.value,
+            "target_mode": target.value,
+            "reason": reason,
+        }
+
+    @staticmethod
+    def _fmt_emergency(old_mode: SystemMode, reason: str, timestamp: str):
+        """Format an emergency trigger as (message, details) / 格式化紧急触发"""
+        return f"Emergency mode triggered: {reason}", {
+            "previous_mode": old_mode.value,
+            "reason": reason,
+            "timestamp": timestamp,
+        }
+
+    @staticmethod
+    def _fmt_switched(old_mode: Optional[SystemMode], new_mode: SystemMode, record: dict):
+        """Format a completed switch as (message, details), details copied from record / 格式化完成的切换（详情复制自记录）"""
+        return f"Mode Switched: {old_mode.value if old_mode else 'None'} -> {new_mode.value}", dict(record)
+
     def __init__(
         self,
         initial_mode: SystemMode = SystemMode.SIMULATION,
         audit_logger: Optional[AuditLogger] = None,
         require_confirmation_for_live: bool = True,
+        history_maxlen: Optional[int] = 10_000,
     ):
         """
         Initialize Mode Manager / 初始化模式管理器
@@ -53,10 +152,12 @@ class ModeManager:
             initial_mode: Initial mode
             audit_logger: Audit logger
             require_confirmation_for_live: Whether switching to LIVE mode requires manual confirmation
+            history_maxlen: Max number of in-memory history records (oldest dropped first), None for unbounded
         """
         self._current_mode = initial_mode
+        self._current_mode_bit = _MODE_BITS[initial_mode]
         self._previous_mode: Optional[SystemMode] = None
-        self._mode_history: list = []
+        self._mode_history: deque = deque(maxlen=history_maxlen)
         self._audit_logger = audit_logger
         self._require_confirmation_for_live = require_confirmation_for_live
         
@@ -76,19 +177,19 @@ class ModeManager:
 
     def is_simulation(self) -> bool:
         """Is simulation mode / 是否为仿真模式"""
-        return self._current_mode == SystemMode.SIMULATION
+        return bool(self._current_mode_bit & _SIMULATION_BIT)
 
     def is_dry_run(self) -> bool:
         """Is dry run mode / 是否为影子模式"""
-        return self._current_mode == SystemMode.DRY_RUN
+        return bool(self._current_mode_bit & _DRY_RUN_BIT)
 
     def is_live(self) -> bool:
         """Is live mode / 是否为实盘模式"""
-        return self._current_mode == SystemMode.LIVE
+        return bool(self._current_mode_bit & _LIVE_BIT)
 
     def is_emergency(self) -> bool:
         """Is emergency mode / 是否为紧急模式"""
-        return self._current_mode == SystemMode.EMERGENCY
+        return bool(self._current_mode_bit & _EMERGENCY_BIT)
 
     def can_trade(self) -> bool:
         """
@@ -98,7 +199,7 @@ class ModeManager:
         Returns:
             bool: Whether real trading is allowed
         """
-        return self._current_mode == SystemMode.LIVE
+        return bool(self._current_mode_bit & _TRADE_MASK)
 
     def can_analyze(self) -> bool:
         """
@@ -108,7 +209,7 @@ class ModeManager:
         Returns:
             bool: Whether analysis is allowed (allowed in all except EMERGENCY)
         """
-        return self._current_mode != SystemMode.EMERGENCY
+        return bool(self._current_mode_bit & _ANALYZE_MASK)
 
     def switch_mode(
         self,
@@ -133,55 +234,51 @@ class ModeManager:
             ModeTransitionError: If switch is not allowed
         """
         if target_mode == self._current_mode:
-            logger.info(f"Target mode is same as current mode, no switch needed: {target_mode.value}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Target mode is same as current mode, no switch needed: {target_mode.value}")
             return True
 
         # Check if transition is allowed / 检查转换是否被允许
-        if not force and target_mode not in self.ALLOWED_TRANSITIONS[self._current_mode]:
-            error_msg = (
-                f"Transition from {self._current_mode.value} to {target_mode.value} is not allowed. "
-                f"Allowed transitions: {[m.value for m in self.ALLOWED_TRANSITIONS[self._current_mode]]}"
+        if not force and not self._TABLE[self._ORD[self._current_mode] * _MODE_COUNT + self._ORD[target_mode]]:
+            # The message is needed for the exception either way / 无论如何异常都需要该信息
+            error_msg, details = self._fmt_denied(
+                self._current_mode, target_mode, self._ALLOWED_VALUES[self._current_mode], reason
             )
             logger.error(error_msg)
             
             # Record denied switch attempt / 记录拒绝的切换尝试
-            if self._audit_logger:
+            if self._audit_logger is not None:
                 self._audit_logger.log_event(
-                    AuditEventType.MODE_SWITCH_DENIED,
-                    error_msg,
-                    details={
-                        "current_mode": self._current_mode.value,
-                        "target_mode": target_mode.value,
-                        "reason": reason,
-                    },
-                    user=user,
+                    AuditEventType.MODE_SWITCH_DENIED, error_msg, details=details, user=user
                 )
             
             raise ModeTransitionError(error_msg)
 
         # LIVE mode requires manual confirmation / LIVE模式需要人工确认
         if target_mode == SystemMode.LIVE and self._require_confirmation_for_live and not force:
-            confirmation_msg = (
-                f"⚠️  WARNING: About to switch to LIVE mode! / 警告: 即将切换到实盘模式 (LIVE)！\n"
-                f"Current mode: {self._current_mode.value}\n"
-                f"Reason: {reason or 'Not provided'}\n"
-                f"Please use force=True to explicitly confirm this operation."
-            )
-            logger.warning(confirmation_msg)
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    f"⚠️  WARNING: About to switch to LIVE mode! / 警告: 即将切换到实盘模式 (LIVE)！\n"
+                    f"Current mode: {self._current_mode.value}\n"
+                    f"Reason: {reason or 'Not provided'}\n"
+                    f"Please use force=True to explicitly confirm this operation."
+                )
             raise ModeTransitionError("Switching to LIVE mode requires explicit confirmation (force=True)")
 
         # Execute switch / 执行切换
         old_mode = self._current_mode
         self._previous_mode = old_mode
         self._current_mode = target_mode
+        self._current_mode_bit = _MODE_BITS[target_mode]
         
         # Record switch / 记录切换
         self._record_mode_change(old_mode, target_mode, reason, user)
         
-        logger.info(
-            f"Mode switch successful: {old_mode.value} -> {target_mode.value} "
-            f"(Reason: {reason or 'Not provided'})"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Mode switch successful: {old_mode.value} -> {target_mode.value} "
+                f"(Reason: {reason or 'Not provided'})"
+            )
         
         return True
 
@@ -206,21 +303,21 @@ class ModeManager:
         old_mode = self._current_mode
         self._previous_mode = old_mode
         self._current_mode = SystemMode.EMERGENCY
+        self._current_mode_bit = _MODE_BITS[SystemMode.EMERGENCY]
+        
+        # One timestamp for the whole trigger / 整个触发过程使用同一时间戳
+        timestamp = datetime.now(timezone.utc).isoformat()
         
         # Record emergency trigger / 记录紧急触发
-        if self._audit_logger:
+        if self._audit_logger is not None:
+            message, details = self._fmt_emergency(old_mode, reason, timestamp)
             self._audit_logger.log_event(
-                AuditEventType.EMERGENCY_TRIGGERED,
-                f"Emergency mode triggered: {reason}",
-                details={
-                    "previous_mode": old_mode.value,
-                    "reason": reason,
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                },
-                user=user,
+                AuditEventType.EMERGENCY_TRIGGERED, message, details=details, user=user
             )
         
-        self._record_mode_change(old_mode, SystemMode.EMERGENCY, f"Emergency Trigger: {reason}", user)
+        self._record_mode_change(
+            old_mode, SystemMode.EMERGENCY, f"Emergency Trigger: {reason}", user, timestamp=timestamp
+        )
         
         return True
 
@@ -230,6 +327,7 @@ class ModeManager:
         new_mode: SystemMode,
         reason: str,
         user: Optional[str] = None,
+        timestamp: Optional[str] = None,
     ) -> None:
         """
         Record Mode Change / 记录模式变更
@@ -239,9 +337,10 @@ class ModeManager:
             new_mode: New mode
             reason: Change reason
             user: Operating user
+            timestamp: ISO timestamp of the change, default is now
         """
         record = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": timestamp or datetime.now(timezone.utc).isoformat(),
             "old_mode": old_mode.value if old_mode else None,
             "new_mode": new_mode.value,
             "reason": reason,
@@ -251,22 +350,27 @@ class ModeManager:
         self._mode_history.append(record)
         
         # Audit log / 审计日志
-        if self._audit_logger:
-            self._audit_logger.log_event(
-                AuditEventType.MODE_SWITCHED,
-                f"Mode Switched: {old_mode.value if old_mode else 'None'} -> {new_mode.value}",
-                details=record,
-                user=user,
-            )
+        if self._audit_logger is not None:
+            message, details = self._fmt_switched(old_mode, new_mode, record)
+            self._audit_logger.log_event(AuditEventType.MODE_SWITCHED, message, details=details, user=user)
 
-    def get_mode_history(self) -> list:
+    def get_mode_history(self) -> tuple:
         """
         Get Mode Change History / 获取模式变更历史
         
         Returns:
-            list: List of mode change records
+            tuple: Snapshot of mode change records, at most history_maxlen most recent
         """
-        return self._mode_history.copy()
+        return tuple(self._mode_history)
+
+    def iter_mode_history(self) -> Iterator[dict]:
+        """
+        Iterate Mode Change History without copying / 无拷贝遍历模式变更历史
+        
+        Returns:
+            Iterator[dict]: Iterator over live records; do not switch modes while iterating
+        """
+        return iter(self._mode_history)
 
     def get_mode_description(self, mode: Optional[SystemMode] = None) -> str:
         """
@@ -278,16 +382,7 @@ class ModeManager:
         Returns:
             str: Mode description
         """
-        target_mode = mode or self._current_mode
-        
-        descriptions = {
-            SystemMode.SIMULATION: "Simulation Mode - Replay/Backtest, No Broker Connection / 仿真模式 - 回放/回测，不连券商",
-            SystemMode.DRY_RUN: "Dry Run Mode - Connected to Market, No Real Orders / 影子模式 - 连行情，不下真实单",
-            SystemMode.LIVE: "Live Mode - Automated Trading / 实盘模式 - 自动交易",
-            SystemMode.EMERGENCY: "Emergency Mode - Only Reduce/Clear Positions, No New Positions / 紧急模式 - 只允许减仓或清仓，禁止新增仓位",
-        }
-        
-        return descriptions.get(target_mode, "Unknown Mode / 未知模式")
+        return self._DESCRIPTIONS.get(mode or self._current_mode, "Unknown Mode / 未知模式")
 
     def __str__(self) -> str:
         """String representation"""
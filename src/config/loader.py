@@ -7,85 +7,146 @@ Responsible for loading runtime configuration, distinct from constitution config
 """
 
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
-from pydantic import BaseModel, Field, ConfigDict
-from dotenv import load_dotenv
+from typing import Dict, Optional
+from dotenv import dotenv_values
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-class RuntimeConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class RuntimeConfig:
     """Runtime Configuration / 运行时配置"""
     
     # System Mode / 系统模式
-    system_mode: str = Field(default="SIMULATION", description="System Operation Mode / 系统运行模式")
+    system_mode: str = field(default="SIMULATION", metadata={"description": "System Operation Mode / 系统运行模式"})
     
     # Log Configuration / 日志配置
-    log_level: str = Field(default="INFO", description="Log Level / 日志级别")
-    log_dir: Path = Field(default=Path("logs"), description="Log Directory / 日志目录")
+    log_level: str = field(default="INFO", metadata={"description": "Log Level / 日志级别"})
+    log_dir: Path = field(default=Path("logs"), metadata={"description": "Log Directory / 日志目录"})
     
     # Constitution Path / 宪法路径
-    constitution_path: Path = Field(default=Path("constitution.yaml"), description="Constitution File Path / 宪法文件路径")
+    constitution_path: Path = field(default=Path("constitution.yaml"), metadata={"description": "Constitution File Path / 宪法文件路径"})
     
     # Data Configuration / 数据配置
-    data_dir: Optional[Path] = Field(default=None, description="Data Directory / 数据目录")
+    data_dir: Optional[Path] = field(default=None, metadata={"description": "Data Directory / 数据目录"})
     
     # API Configuration / API配置
-    broker_api_key: Optional[str] = Field(default=None, description="Broker API Key / 券商API密钥")
-    broker_api_secret: Optional[str] = Field(default=None, description="Broker API Secret / 券商API密钥")
-    llm_api_key: Optional[str] = Field(default=None, description="LLM API Key / LLM API密钥")
+    broker_api_key: Optional[str] = field(default=None, metadata={"description": "Broker API Key / 券商API密钥"})
+    broker_api_secret: Optional[str] = field(default=None, metadata={"description": "Broker API Secret / 券商API密钥"})
+    llm_api_key: Optional[str] = field(default=None, metadata={"description": "LLM API Key / LLM API密钥"})
     
     # Environment / 环境标识
-    environment: str = Field(default="development", description="Running Environment / 运行环境")
+    environment: str = field(default="development", metadata={"description": "Running Environment / 运行环境"})
     
-    model_config = ConfigDict(extra="allow")
+    # Absolute paths, resolved once per load / 绝对路径（每次加载解析一次）
+    resolved_log_dir: Optional[Path] = field(default=None, metadata={"description": "Resolved Log Directory / 解析后的日志目录"})
+    resolved_constitution_path: Optional[Path] = field(default=None, metadata={"description": "Resolved Constitution File Path / 解析后的宪法文件路径"})
 
 
 class ConfigLoader:
     """Config Loader / 配置加载器"""
     
-    def __init__(self, env_file: Optional[Path] = None):
+    __slots__ = ("env_file", "_config", "_env_mtime", "_env_values", "_cache_key", "_inject_environ")
+    
+    # Environment variables read by load() / load()读取的环境变量
+    _ENV_KEYS = (
+        "SYSTEM_MODE",
+        "LOG_LEVEL",
+        "LOG_DIR",
+        "CONSTITUTION_PATH",
+        "DATA_DIR",
+        "BROKER_API_KEY",
+        "BROKER_API_SECRET",
+        "LLM_API_KEY",
+        "ENVIRONMENT",
+    )
+    
+    def __init__(self, env_file: Optional[Path] = None, inject_environ: bool = False):
         """
         Initialize Config Loader / 初始化配置加载器
         
         Args:
             env_file: .env file path, default is .env in current directory
+            inject_environ: Whether to also export .env values into os.environ (existing variables are kept)
         """
         self.env_file = env_file or Path(".env")
         self._config: Optional[RuntimeConfig] = None
+        self._env_mtime: Optional[int] = -1  # -1: .env not checked yet / 尚未检查
+        self._env_values: Dict[str, str] = {}
+        self._cache_key: Optional[tuple] = None
+        self._inject_environ = inject_environ
     
     def load(self) -> RuntimeConfig:
         """
         Load Runtime Configuration / 加载运行时配置
         
+        The .env file is parsed only when its mtime changes and is not written
+        to os.environ unless inject_environ is set. Process environment
+        variables take precedence over .env values. The result is reused while
+        the .env file, the relevant environment variables and the working
+        directory are unchanged.
+        
         Returns:
             RuntimeConfig: Runtime configuration object
         """
         logger.info("Start loading runtime configuration / 开始加载运行时配置")
         
-        # Load .env file / 加载.env文件
-        if self.env_file.exists():
-            load_dotenv(self.env_file)
-            logger.info(f"Loaded environment file: {self.env_file} / 已加载环境文件")
-        else:
-            logger.warning(f"Environment file not found: {self.env_file}, using defaults / 环境文件不存在，使用默认配置")
+        # Parse .env file when it changed / .env文件变更时解析
+        try:
+            env_mtime = self.env_file.stat().st_mtime_ns
+        except OSError:
+            env_mtime = None
         
-        # Build config from environment variables / 从环境变量构建配置
+        if env_mtime != self._env_mtime:
+            if env_mtime is not None:
+                # Keys without a value parse as None / 无值的键解析为None
+                self._env_values = {
+                    key: value for key, value in dotenv_values(self.env_file).items() if value is not None
+                }
+                if self._inject_environ:
+                    for key, value in self._env_values.items():
+                        os.environ.setdefault(key, value)
+                logger.info(f"Loaded environment file: {self.env_file} / 已加载环境文件")
+            else:
+                self._env_values = {}
+                logger.warning(f"Environment file not found: {self.env_file}, using defaults / 环境文件不存在，使用默认配置")
+            self._env_mtime = env_mtime
+        
+        # Reuse config while environment is unchanged / 环境未变时复用配置
+        environ = os.environ
+        env_values = self._env_values
+        env = {}
+        for key in self._ENV_KEYS:
+            value = environ.get(key, env_values.get(key))
+            if value is not None:
+                env[key] = value
+        # resolved_* paths depend on the working directory / resolved_*路径依赖当前工作目录
+        cache_key = (env_mtime, tuple(env.items()), os.getcwd())
+        if self._config is not None and cache_key == self._cache_key:
+            return self._config
+        
+        # Build config from environment variables, converting types explicitly / 从环境变量构建配置并显式转换类型
         config_data = {
-            "system_mode": os.getenv("SYSTEM_MODE", "SIMULATION"),
-            "log_level": os.getenv("LOG_LEVEL", "INFO"),
-            "log_dir": Path(os.getenv("LOG_DIR", "logs")),
-            "constitution_path": Path(os.getenv("CONSTITUTION_PATH", "constitution.yaml")),
-            "data_dir": Path(os.getenv("DATA_DIR")) if os.getenv("DATA_DIR") else None,
-            "broker_api_key": os.getenv("BROKER_API_KEY"),
-            "broker_api_secret": os.getenv("BROKER_API_SECRET"),
-            "llm_api_key": os.getenv("LLM_API_KEY"),
-            "environment": os.getenv("ENVIRONMENT", "development"),
+            "system_mode": env.get("SYSTEM_MODE", "SIMULATION"),
+            "log_level": env.get("LOG_LEVEL", "INFO"),
+            "log_dir": Path(env.get("LOG_DIR", "logs")),
+            "constitution_path": Path(env.get("CONSTITUTION_PATH", "constitution.yaml")),
+            "data_dir": Path(env["DATA_DIR"]) if env.get("DATA_DIR") else None,
+            "broker_api_key": env.get("BROKER_API_KEY"),
+            "broker_api_secret": env.get("BROKER_API_SECRET"),
+            "llm_api_key": env.get("LLM_API_KEY"),
+            "environment": env.get("ENVIRONMENT", "development"),
         }
         
+        # Resolve paths once so downstream code can skip repeat resolve() / 一次性解析路径，下游无需重复 resolve()
+        config_data["resolved_log_dir"] = config_data["log_dir"].resolve(strict=False)
+        config_data["resolved_constitution_path"] = config_data["constitution_path"].resolve(strict=False)
+        
         self._config = RuntimeConfig(**config_data)
+        self._cache_key = cache_key
         logger.info(f"Config loaded: mode={self._config.system_mode}, env={self._config.environment} / 配置加载完成")
         
         return self._config
@@ -4,7 +4,7 @@
 
 from .schema import Constitution, RiskBudget, MarketState, EmergencyRules, SystemIdentity
 from .loader import ConstitutionLoader
-from .validator import ConstitutionValidator
+from .validator import ConstitutionValidator, SectionID
 
 __all__ = [
     "Constitution",
@@ -14,5 +14,6 @@ __all__ = [
     "SystemIdentity",
     "ConstitutionLoader",
     "ConstitutionValidator",
+    "SectionID",
 ]
 
@@ -6,46 +6,145 @@ Responsible for loading constitution configuration from YAML files and convertin
 负责从YAML文件加载宪法配置并转换为Python对象。
 """
 
+import json
+import os
+import tempfile
 import yaml
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Union
 import logging
 
-from .schema import Constitution
+from pydantic import TypeAdapter
+
+from .schema import Constitution, NON_EMPTY_LIST_FIELDS
+
+# libyaml C loader when PyYAML was built with it / PyYAML带libyaml时使用C加载器
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 logger = logging.getLogger(__name__)
 
+# Mode for new cache files under the process umask / 按进程umask计算的缓存文件权限
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_CACHE_FILE_MODE = 0o666 & ~_UMASK
+
 
 class ConstitutionLoadError(Exception):
     """Constitution Load Error / 宪法加载错误"""
     pass
 
 
+@lru_cache(maxsize=None)
+def _section_adapter(name: str) -> TypeAdapter:
+    """Get validator for one Constitution section / 获取单个宪法章节的验证器"""
+    return TypeAdapter(Constitution.model_fields[name].annotation)
+
+
+class LazyConstitution:
+    """
+    Lazy Constitution / 惰性宪法
+    
+    Holds the composed YAML nodes of each section and builds the section
+    model on first attribute access, so callers that only need e.g.
+    risk_budget do not pay for validating the whole constitution.
+    首次访问属性时才构建对应章节模型。
+    """
+
+    def __init__(self, section_nodes: Dict[str, yaml.Node]):
+        """
+        Initialize Lazy Constitution / 初始化惰性宪法
+        
+        Args:
+            section_nodes: Section name -> composed YAML node
+        """
+        self._section_nodes = section_nodes
+
+    def __getattr__(self, name: str) -> Any:
+        """Materialize a section on first access / 首次访问时构建章节"""
+        if name.startswith("_") or name not in Constitution.model_fields:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        
+        node = self._section_nodes.get(name)
+        if node is None:
+            raise ConstitutionLoadError(f"Constitution missing section: {name} / 宪法缺少章节")
+        
+        try:
+            data = _YamlLoader("").construct_document(node)
+            value = _section_adapter(name).validate_python(data)
+            if name in NON_EMPTY_LIST_FIELDS:
+                value = Constitution.validate_non_empty_list(value)
+        except yaml.YAMLError as e:
+            raise ConstitutionLoadError(f"YAML parsing failed: {str(e)}") from e
+        except Exception as e:
+            raise ConstitutionLoadError(f"Constitution section '{name}' validation failed: {str(e)}") from e
+        
+        # Later lookups hit the instance dict directly / 之后直接命中实例字典
+        self.__dict__[name] = value
+        return value
+
+    def materialize(self) -> Constitution:
+        """
+        Build the full Constitution object / 构建完整的宪法对象
+        
+        Returns:
+            Constitution: Fully validated constitution
+        """
+        return Constitution(**{name: getattr(self, name) for name in Constitution.model_fields})
+
+    # Same helpers as Constitution, touching only the sections they need / 与Constitution相同的辅助方法
+    risk_limits = cached_property(Constitution.risk_limits.func)
+    emergency_triggers = cached_property(Constitution.emergency_triggers.func)
+    get_risk_limits = Constitution.get_risk_limits
+    get_market_state_parameters = Constitution.get_market_state_parameters
+    get_emergency_triggers = Constitution.get_emergency_triggers
+
+
 class ConstitutionLoader:
     """Constitution Loader / 宪法加载器"""
 
-    def __init__(self, constitution_path: Optional[Path] = None):
+    def __init__(self, constitution_path: Optional[Path] = None, use_cache: bool = False, lazy: bool = False):
         """
         Initialize Constitution Loader / 初始化宪法加载器
         
         Args:
             constitution_path: Path to constitution file, default is constitution.yaml
+            use_cache: Whether to use the JSON sidecar cache of the parsed YAML; opt-in, since
+                it writes a hidden file next to the YAML
+            lazy: Return a LazyConstitution that validates sections on first access
         """
         if constitution_path is None:
             constitution_path = Path("constitution.yaml")
         
         self.constitution_path = Path(constitution_path)
-        self._constitution: Optional[Constitution] = None
+        self.use_cache = use_cache
+        self.lazy = lazy
+        self._constitution: Optional[Union[Constitution, LazyConstitution]] = None
+        self._last_stat: Optional[tuple] = None
+
+    @property
+    def cache_path(self) -> Path:
+        """
+        Get sidecar cache file path / 获取缓存文件路径
+        
+        Returns:
+            Path: e.g. .constitution.yaml.cache.json next to the YAML file
+        """
+        return self.constitution_path.with_name(f".{self.constitution_path.name}.cache.json")
 
-    def load(self, validate: bool = True) -> Constitution:
+    def load(self, validate: bool = True, force: bool = False) -> Union[Constitution, LazyConstitution]:
         """
         Load Constitution Configuration / 加载宪法配置
         
         Args:
             validate: Whether to validate after loading
+            force: Re-parse even if the file is unchanged since the last load
             
         Returns:
-            Constitution: Constitution object
+            Constitution: Constitution object, LazyConstitution in lazy mode
             
         Raises:
             ConstitutionLoadError: Raised when loading fails
@@ -54,14 +153,33 @@ class ConstitutionLoader:
             logger.info(f"Start loading constitution file: {self.constitution_path}")
             
             # Check if file exists / 检查文件是否存在
-            if not self.constitution_path.exists():
+            try:
+                stat = self.constitution_path.stat()
+            except FileNotFoundError:
                 raise ConstitutionLoadError(
                     f"Constitution file does not exist: {self.constitution_path}"
                 )
             
-            # Read YAML file / 读取YAML文件
-            with open(self.constitution_path, "r", encoding="utf-8") as f:
-                raw_data = yaml.safe_load(f)
+            # Unchanged since last load, reuse validated object / 自上次加载未变更，复用已验证对象
+            file_stat = (stat.st_mtime_ns, stat.st_size)
+            if not force and self._constitution is not None and file_stat == self._last_stat:
+                logger.info("Constitution file unchanged, using loaded constitution / 宪法文件未变更，使用已加载的宪法")
+                return self._constitution
+            
+            if self.lazy:
+                self._constitution = self._load_lazy()
+                self._last_stat = file_stat
+                logger.info("Constitution loaded lazily / 宪法已惰性加载")
+                return self._constitution
+            
+            # Read YAML file, reusing the JSON cache when unchanged / 读取YAML文件，未变更时复用JSON缓存
+            cache_key = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+            raw_data = self._read_cache(cache_key) if self.use_cache else None
+            from_cache = raw_data is not None
+            
+            if raw_data is None:
+                with open(self.constitution_path, "r", encoding="utf-8") as f:
+                    raw_data = yaml.load(f, Loader=_YamlLoader)
             
             if not raw_data:
                 raise ConstitutionLoadError("Constitution file is empty / 宪法文件为空")
@@ -75,10 +193,16 @@ class ConstitutionLoader:
             # Convert to Constitution object / 转换为Constitution对象
             try:
                 self._constitution = Constitution(**constitution_data)
-                logger.info("Constitution loaded successfully / 宪法加载成功")
-                return self._constitution
             except Exception as e:
                 raise ConstitutionLoadError(f"Constitution data validation failed: {str(e)}") from e
+            
+            # Only cache data that passed validation / 仅缓存通过验证的数据
+            if self.use_cache and not from_cache:
+                self._write_cache(cache_key, raw_data)
+            
+            self._last_stat = file_stat
+            logger.info("Constitution loaded successfully / 宪法加载成功")
+            return self._constitution
                 
         except yaml.YAMLError as e:
             raise ConstitutionLoadError(f"YAML parsing failed: {str(e)}") from e
@@ -87,18 +211,96 @@ class ConstitutionLoader:
                 raise
             raise ConstitutionLoadError(f"Unknown error occurred while loading constitution: {str(e)}") from e
 
-    def reload(self) -> Constitution:
+    def _load_lazy(self) -> LazyConstitution:
+        """
+        Compose YAML without constructing sections / 组合YAML节点但不构建章节
+        
+        Returns:
+            LazyConstitution: Lazy constitution over the section nodes
+        """
+        with open(self.constitution_path, "r", encoding="utf-8") as f:
+            root = yaml.compose(f, Loader=_YamlLoader)
+        
+        if root is None or not root.value:
+            raise ConstitutionLoadError("Constitution file is empty / 宪法文件为空")
+        
+        root_items = {key.value: value for key, value in root.value} if isinstance(root, yaml.MappingNode) else {}
+        constitution_node = root_items.get("constitution")
+        if not isinstance(constitution_node, yaml.MappingNode):
+            raise ConstitutionLoadError("Constitution file missing 'constitution' root key / 宪法文件缺少'constitution'根键")
+        
+        return LazyConstitution({key.value: value for key, value in constitution_node.value})
+
+    def _read_cache(self, cache_key: dict) -> Optional[Any]:
+        """
+        Read parsed data from sidecar cache / 从缓存文件读取解析结果
+        
+        Args:
+            cache_key: Expected header, {"mtime_ns": ..., "size": ...}
+            
+        Returns:
+            Parsed data, None on cache miss or unreadable cache
+        """
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                if json.loads(f.readline()) != cache_key:
+                    return None
+                return json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, cache_key: dict, raw_data: Any) -> None:
+        """
+        Atomically write parsed data to sidecar cache / 原子写入缓存文件
+        
+        Skipped when the data does not survive a JSON round trip unchanged (e.g.
+        int/bool mapping keys, dates), so cached and uncached loads always
+        validate the same data.
+        
+        Args:
+            cache_key: Header identifying the source file state
+            raw_data: Parsed YAML data
+        """
+        try:
+            data_json = json.dumps(raw_data, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Constitution data not JSON serializable, skip cache: {e}")
+            return
+        if json.loads(data_json) != raw_data:
+            logger.debug("Constitution data changes in a JSON round trip, skip cache / 数据经JSON往返后改变，跳过缓存")
+            return
+        payload = json.dumps(cache_key) + "\n" + data_json
+        
+        cache_path = self.cache_path
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(payload)
+                # mkstemp creates 0600, use the mode a plain open() would / mkstemp创建为0600，改为普通open()的权限
+                os.chmod(tmp_path, _CACHE_FILE_MODE)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug(f"Failed to write constitution cache {cache_path}: {e}")
+
+    def reload(self, force: bool = False) -> Union[Constitution, LazyConstitution]:
         """
         Reload Constitution Configuration / 重新加载宪法配置
         
+        Args:
+            force: Re-parse even if the file is unchanged
+        
         Returns:
             Constitution: Constitution object
         """
         logger.info("Reloading constitution configuration / 重新加载宪法配置")
-        return self.load()
+        return self.load(force=force)
 
     @property
-    def constitution(self) -> Constitution:
+    def constitution(self) -> Union[Constitution, LazyConstitution]:
         """
         Get currently loaded constitution object / 获取当前加载的宪法对象
         
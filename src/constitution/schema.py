@@ -6,7 +6,8 @@ Define all data structures in the constitution using Pydantic to ensure type saf
 使用 Pydantic 定义宪法中的所有数据结构，确保类型安全和数据验证。
 """
 
-from typing import List, Optional, Dict, Any
+from functools import cached_property
+from typing import List, Optional, Dict, Any, Tuple, ClassVar
 from enum import Enum
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
@@ -26,13 +27,17 @@ class MarketStateType(str, Enum):
     DANGEROUS = "dangerous_market" # 危险市场
 
 
+# Constitution list fields that must not be empty / 不能为空的宪法列表字段
+NON_EMPTY_LIST_FIELDS = ("core_principles", "cash_management_philosophy", "final_principles")
+
+
 class SystemIdentity(BaseModel):
     """System Identity Declaration / 系统身份声明"""
     system_type: str = Field(description="System Type / 系统类型")
     operation_frequency: str = Field(description="Operation Frequency / 操作频率")
     inspirations: List[str] = Field(description="Inspirations / 灵感来源")
     
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 
 class MarketStateParameters(BaseModel):
@@ -43,7 +48,7 @@ class MarketStateParameters(BaseModel):
     min_cash_ratio: Optional[float] = Field(None, ge=0.0, le=1.0, description="Min Cash Ratio / 现金比例下限")
     allow_adding_position: Optional[bool] = Field(None, description="Allow Adding to Existing Positions / 是否允许对现有持仓加仓")
     
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 
 class MarketState(BaseModel):
@@ -52,7 +57,7 @@ class MarketState(BaseModel):
     definitions: Dict[str, str] = Field(description="State Definitions / 市场状态定义")
     parameters: Dict[str, MarketStateParameters] = Field(description="Parameters for Different Market States / 不同市场状态的参数")
     
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 
 class RiskBudget(BaseModel):
@@ -63,7 +68,7 @@ class RiskBudget(BaseModel):
     max_drawdown: float = Field(ge=0.0, le=1.0, description="Max Drawdown Limit / 最大回撤限制")
     liquidity_requirements: Dict[str, Any] = Field(description="Liquidity Requirements / 流动性要求")
     
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 
 class QualityStandards(BaseModel):
@@ -72,7 +77,7 @@ class QualityStandards(BaseModel):
     financial_health: List[str] = Field(description="Financial Health Assessment Standards / 财务健康评估标准")
     management: List[str] = Field(description="Management Assessment Standards / 管理层评估标准")
     
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 
 class SafetyMargin(BaseModel):
@@ -81,7 +86,7 @@ class SafetyMargin(BaseModel):
     preferred: str = Field(description="Preferred Valuation Requirement / 优选估值要求")
     excellent: str = Field(description="Excellent Valuation Requirement / 极佳估值要求")
     
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 
 class ValuationPrinciples(BaseModel):
@@ -89,7 +94,7 @@ class ValuationPrinciples(BaseModel):
     safety_margin: SafetyMargin = Field(description="Safety Margin Configuration / 安全边际配置")
     methods: List[str] = Field(description="Valuation Methods / 估值方法")
     
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 
 class EmergencyRules(BaseModel):
@@ -98,7 +103,7 @@ class EmergencyRules(BaseModel):
     response_plan: Dict[str, str] = Field(description="Response Plan / 应对预案")
     cooldown_rules: List[str] = Field(description="Cooldown Rules / 冷静期规则")
     
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 
 class ExecutionDiscipline(BaseModel):
@@ -106,7 +111,7 @@ class ExecutionDiscipline(BaseModel):
     best_practices: List[str] = Field(description="Trading Best Practices / 交易最佳实践")
     price_protection: List[str] = Field(description="Price Protection Configuration / 价格保护配置")
     
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 
 class LLMGuidelines(BaseModel):
@@ -115,7 +120,7 @@ class LLMGuidelines(BaseModel):
     usage_scope: List[str] = Field(description="Allowed Usage Scope / 允许使用的范围")
     restrictions: List[str] = Field(description="Restrictions / 限制规则")
     
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 
 class StressTestRequirements(BaseModel):
@@ -123,7 +128,7 @@ class StressTestRequirements(BaseModel):
     historical_scenarios: List[str] = Field(description="Mandatory Historical Scenarios / 必须测试的历史场景")
     passing_criteria: List[str] = Field(description="Passing Criteria / 通过标准")
     
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 
 class InvestmentChecklist(BaseModel):
@@ -131,7 +136,7 @@ class InvestmentChecklist(BaseModel):
     before_buying: List[str] = Field(description="Questions Before Buying / 买入前必须回答的问题")
     during_holding: List[str] = Field(description="Monitoring During Holding / 持有期间监控的问题")
     
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 
 class MetaInfo(BaseModel):
@@ -141,7 +146,7 @@ class MetaInfo(BaseModel):
     philosophy: str = Field(description="Investment Philosophy / 投资哲学")
     risk_first: str = Field(description="Risk First Principle / 风险第一原则")
     
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 
 class Constitution(BaseModel):
@@ -161,9 +166,9 @@ class Constitution(BaseModel):
     cash_management_philosophy: List[str] = Field(alias="cash_management_philosophy") # 现金管理哲学
     final_principles: List[str] = Field(alias="final_principles") # 最终原则
     
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
-    @field_validator("core_principles", "cash_management_philosophy", "final_principles")
+    @field_validator(*NON_EMPTY_LIST_FIELDS)
     @classmethod
     def validate_non_empty_list(cls, v: List[str]) -> List[str]:
         """Validate list is not empty / 验证列表不为空"""
@@ -171,8 +176,24 @@ class Constitution(BaseModel):
             raise ValueError("List cannot be empty / 列表不能为空")
         return v
 
-    def get_risk_limits(self) -> Dict[str, float]:
-        """Get Risk Limit Parameters / 获取风险限制参数"""
+    # Derived values cached on the instance, dropped by model_copy / 实例上缓存的派生值，model_copy时清除
+    _CACHED_PROPERTIES: ClassVar[Tuple[str, ...]] = ("risk_limits", "emergency_triggers")
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "Constitution":
+        """
+        Copy the model without cached derived values / 复制模型但不带缓存的派生值
+        
+        pydantic copies __dict__, cached_property values included, so a copy with
+        `update` would otherwise serve values computed from the old sections.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        for name in self._CACHED_PROPERTIES:
+            copied.__dict__.pop(name, None)
+        return copied
+
+    @cached_property
+    def risk_limits(self) -> Dict[str, float]:
+        """Risk Limit Parameters, computed once / 风险限制参数（只计算一次）"""
         return {
             "max_capital_usage": self.risk_budget.max_capital_usage,
             "max_single_position": self.risk_budget.max_single_position,
@@ -180,10 +201,19 @@ class Constitution(BaseModel):
             "max_drawdown": self.risk_budget.max_drawdown,
         }
 
+    @cached_property
+    def emergency_triggers(self) -> Tuple[str, ...]:
+        """Emergency Triggers, computed once / 紧急触发器（只计算一次）"""
+        return tuple(self.emergency_rules.triggers)
+
+    def get_risk_limits(self) -> Dict[str, float]:
+        """Get Risk Limit Parameters / 获取风险限制参数"""
+        return self.risk_limits.copy()
+
     def get_market_state_parameters(self, state: str) -> Optional[MarketStateParameters]:
         """Get Parameters for Specific Market State / 获取特定市场状态的参数"""
         return self.market_state.parameters.get(state)
 
     def get_emergency_triggers(self) -> List[str]:
         """Get Emergency Triggers List / 获取紧急触发器列表"""
-        return self.emergency_rules.triggers
+        return list(self.emergency_triggers)
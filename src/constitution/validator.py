@@ -7,20 +7,90 @@ Responsible for validating the integrity and business logic correctness of the c
 """
 
 import logging
-from typing import List, Optional
+from enum import IntEnum
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Callable, Iterable, List, Mapping, Optional, Tuple, Union
 from .schema import Constitution, MarketStateParameters
 
 logger = logging.getLogger(__name__)
 
+# Standard market states, from most to least permissive / 标准市场状态（从宽松到严格）
+_REQUIRED_STATES = ("normal_market", "cautious_market", "dangerous_market")
+_REQUIRED_STATES_SET = frozenset(_REQUIRED_STATES)
+
+# Reasonableness thresholds for warnings / 合理性警告阈值
+_MAX_SINGLE_POSITION_WARN = 0.25
+_MIN_DRAWDOWN_WARN = 0.1
+_MAX_DRAWDOWN_WARN = 0.3
+_MIN_RESPONSE_STAGES = 2
+
+# Shared read-only report for a run without errors or warnings / 无错误无警告时共享的只读报告
+_EMPTY_REPORT = MappingProxyType({
+    "valid": True,
+    "error_count": 0,
+    "warning_count": 0,
+    "errors": (),
+    "warnings": (),
+})
+
+# Static messages, shared by every validation run / 静态信息，所有验证共用
+_ERR_CAPITAL_PROGRESSION = "Market state max capital usage should decrease (Normal >= Cautious >= Dangerous)"
+_ERR_POSITION_PROGRESSION = "Market state max single position should decrease (Normal >= Cautious >= Dangerous)"
+_ERR_EMERGENCY_TRIGGERS = "Emergency rules missing triggers"
+_ERR_EMERGENCY_RESPONSE_PLAN = "Emergency rules missing response plan"
+_WARN_RESPONSE_STAGES = "Response plan suggests multiple stages (Warning/Crisis/Extreme)"
+_WARN_BEST_PRACTICES = "Execution discipline missing best practices"
+_WARN_PRICE_PROTECTION = "Suggest configuring price protection rules"
+
+# Fields that must be non-empty: (dotted path, message, severity) / 必须非空的字段：(路径, 信息, 严重级别)
+_REQUIRED_FIELDS = (
+    ("quality_standards.business_model", "Quality standards missing business model assessment", "error"),
+    ("quality_standards.financial_health", "Quality standards missing financial health assessment", "error"),
+    ("quality_standards.management", "Quality standards missing management assessment", "error"),
+    ("valuation_principles.safety_margin", "Valuation principles missing safety margin configuration", "error"),
+    ("valuation_principles.methods", "Valuation principles missing valuation methods", "error"),
+    ("investment_checklist.before_buying", "Investment checklist missing pre-buy questions", "error"),
+    ("investment_checklist.during_holding", "Investment checklist missing holding monitoring questions", "error"),
+    ("llm_guidelines.usage_scope", "Suggest defining LLM usage scope", "warning"),
+    ("llm_guidelines.restrictions", "Suggest setting LLM restrictions", "warning"),
+)
+
+# (getter, message, is_error), getters built once at import / 导入时构建一次取值器
+_REQUIRED_FIELD_CHECKS = tuple(
+    (attrgetter(path), message, severity == "error") for path, message, severity in _REQUIRED_FIELDS
+)
+
 
 class ValidationError(Exception):
     """Validation Error / 验证错误"""
     pass
 
 
+class SectionID(IntEnum):
+    """Validation Section, valued by pipeline position / 验证分区（值为流水线位置）"""
+    RISK_BUDGET = 0
+    MARKET_STATE = 1
+    EMERGENCY_RULES = 2
+    EXECUTION_DISCIPLINE = 3
+    BUSINESS_LOGIC = 4
+
+
+# Constitution field -> section checking it; other fields are not checked / 宪法字段 -> 检查它的分区（其他字段不做检查）
+_FIELD_SECTIONS: Mapping[str, SectionID] = MappingProxyType({
+    "risk_budget": SectionID.RISK_BUDGET,
+    "market_state": SectionID.MARKET_STATE,
+    "emergency_rules": SectionID.EMERGENCY_RULES,
+    "execution_discipline": SectionID.EXECUTION_DISCIPLINE,
+    **{path.split(".", 1)[0]: SectionID.BUSINESS_LOGIC for path, _, _ in _REQUIRED_FIELDS},
+})
+
+
 class ConstitutionValidator:
     """Constitution Validator / 宪法验证器"""
 
+    __slots__ = ("_constitution", "errors", "warnings", "_section_results", "_cache", "_pipeline")
+
     def __init__(self, constitution: Constitution):
         """
         Initialize Validator / 初始化验证器
@@ -28,56 +98,132 @@ class ConstitutionValidator:
         Args:
             constitution: Constitution object to validate
         """
-        self.constitution = constitution
+        self._constitution = constitution
         self.errors: List[str] = []
         self.warnings: List[str] = []
+        # Last (errors, warnings) per SectionID, None if not run / 按SectionID索引的上次结果，未执行为None
+        self._section_results: List[Optional[Tuple[List[str], List[str]]]] = [None] * len(SectionID)
+        # Full validation result of the current constitution, None if stale / 当前宪法的完整验证结果，失效时为None
+        self._cache: Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]] = None
+        # (section, bound validator), indexed by SectionID / 按SectionID索引的(分区, 绑定方法)
+        self._pipeline: Tuple[Tuple[SectionID, Callable[[], None]], ...] = tuple(
+            (section, getattr(self, self._SECTION_VALIDATORS[section])) for section in SectionID
+        )
+
+    @property
+    def constitution(self) -> Constitution:
+        """Constitution being validated / 被验证的宪法"""
+        return self._constitution
+
+    @constitution.setter
+    def constitution(self, constitution: Constitution) -> None:
+        """Replace constitution and drop the cached result / 替换宪法并清除缓存结果"""
+        self._constitution = constitution
+        self.invalidate_cache()
+
+    def invalidate_cache(self) -> None:
+        """
+        Drop the cached validation result / 清除缓存的验证结果
+        
+        Must be called after mutating the constitution in place (e.g. a nested
+        dict or list), since frozen models only block attribute assignment.
+        原地修改宪法（如嵌套字典或列表）后必须调用，冻结模型只阻止属性赋值。
+        """
+        self._cache = None
 
-    def validate(self, strict: bool = True) -> bool:
+    def validate(
+        self,
+        strict: bool = True,
+        changed_sections: Optional[Iterable[Union[SectionID, str]]] = None,
+    ) -> bool:
         """
-        Execute Full Validation / 执行完整验证
+        Execute Validation / 执行验证
+        
+        The last full validation result is cached and repeat calls only redo the
+        summary. Assigning `constitution` clears the cache; frozen models are only
+        frozen at the top level, so after mutating nested values in place call
+        invalidate_cache() or pass changed_sections. Every section is always checked; a check only
+        skips the parts whose own inputs are missing.
         
         Args:
             strict: Strict mode (warnings count as failure)
+            changed_sections: What changed since the last validate(): Constitution field names
+                (e.g. "quality_standards"), SectionID members or their lowercase names; None for
+                full validation. Only the affected sections (and sections depending on them) are
+                re-checked, results of the other sections are reused.
             
         Returns:
             bool: Whether validation passed
             
         Raises:
             ValidationError: If validation fails and strict=True
+            TypeError: If changed_sections is a single string instead of a collection
+            ValueError: If changed_sections contains an unknown field or section
         """
-        self.errors.clear()
-        self.warnings.clear()
+        logger.debug("Start validating constitution configuration / 开始验证宪法配置")
         
-        logger.info("Start validating constitution configuration / 开始验证宪法配置")
+        cached = self._cache if changed_sections is None else None
         
-        # Execute validations / 执行各项验证
-        self._validate_risk_budget()
-        self._validate_market_states()
-        self._validate_emergency_rules()
-        self._validate_execution_discipline()
-        self._validate_business_logic()
+        if cached is not None:
+            self.errors = list(cached[0])
+            self.warnings = list(cached[1])
+        else:
+            if changed_sections is None:
+                rerun = self._ALL_SECTIONS
+            else:
+                rerun = self._expand_sections(changed_sections)
+            
+            # Execute validations, each section into its own lists / 执行各项验证，每个分区写入独立列表
+            results = self._section_results
+            for section, validate_section in self._pipeline:
+                if rerun & (1 << section) or results[section] is None:
+                    self.errors = []
+                    self.warnings = []
+                    validate_section()
+                    results[section] = (self.errors, self.warnings)
+            
+            # Collect in pipeline order / 按流水线顺序汇总
+            self.errors = [error for section_errors, _ in results for error in section_errors]
+            self.warnings = [warning for _, section_warnings in results for warning in section_warnings]
+            self._cache = (tuple(self.errors), tuple(self.warnings))
         
         # Summarize results / 汇总结果
-        has_errors = len(self.errors) > 0
-        has_warnings = len(self.warnings) > 0
-        
-        if has_errors:
+        if self.errors:
             error_msg = f"Constitution validation failed, found {len(self.errors)} errors / 宪法验证失败，发现 {len(self.errors)} 个错误"
             logger.error(error_msg)
             for error in self.errors:
-                logger.error(f"  - {error}")
+                logger.error("  - %s", error)
             if strict:
                 raise ValidationError(f"{error_msg}: {'; '.join(self.errors)}")
-            return False
-        
-        if has_warnings:
-            logger.warning(f"Constitution validation passed with {len(self.warnings)} warnings / 宪法验证通过，但有 {len(self.warnings)} 个警告")
+        elif self.warnings:
+            warning_count = len(self.warnings)
+            logger.warning(
+                "Constitution validation passed with %d warnings / 宪法验证通过，但有 %d 个警告",
+                warning_count,
+                warning_count,
+            )
             for warning in self.warnings:
-                logger.warning(f"  - {warning}")
-            if strict:
-                return False
+                logger.warning("  - %s", warning)
+        
+        passed = self._decide(strict)
+        if passed:
+            logger.info("Constitution validation passed / 宪法验证通过")
+        return passed
+
+    def _decide(self, strict: bool) -> bool:
+        """
+        Decide pass/fail from current findings without re-running checks / 根据现有结果判定，不重新执行检查
         
-        logger.info("Constitution validation passed / 宪法验证通过")
+        Args:
+            strict: Strict mode (warnings count as failure)
+            
+        Returns:
+            bool: Whether validation passed
+        """
+        if self.errors:
+            return False
+        if self.warnings and strict:
+            return False
         return True
 
     def _validate_risk_budget(self) -> None:
@@ -96,17 +242,17 @@ class ConstitutionValidator:
             )
         
         # Validate reasonableness / 验证合理性
-        if risk.max_single_position > 0.25:
+        if risk.max_single_position > _MAX_SINGLE_POSITION_WARN:
             self.warnings.append(
-                f"Max single position too high ({risk.max_single_position}), suggest not exceeding 25%"
+                f"Max single position too high ({risk.max_single_position}), suggest not exceeding {_MAX_SINGLE_POSITION_WARN:.0%}"
             )
         
-        if risk.max_drawdown < 0.1:
+        if risk.max_drawdown < _MIN_DRAWDOWN_WARN:
             self.warnings.append(
                 f"Max drawdown limit too strict ({risk.max_drawdown}), may cause excessive stop-loss"
             )
         
-        if risk.max_drawdown > 0.3:
+        if risk.max_drawdown > _MAX_DRAWDOWN_WARN:
             self.warnings.append(
                 f"Max drawdown limit too loose ({risk.max_drawdown}), high risk"
             )
@@ -116,30 +262,25 @@ class ConstitutionValidator:
         market_state = self.constitution.market_state
         
         # Check if all three standard states exist / 检查三个标准状态是否都存在
-        required_states = ["normal_market", "cautious_market", "dangerous_market"]
-        for state in required_states:
+        for state in _REQUIRED_STATES:
             if state not in market_state.parameters:
                 self.errors.append(f"Missing market state parameters: {state}")
             if state not in market_state.definitions:
                 self.errors.append(f"Missing market state definition: {state}")
         
         # Validate progressive relationship of parameters / 验证市场状态参数的递进关系
-        if all(state in market_state.parameters for state in required_states):
+        if _REQUIRED_STATES_SET.issubset(market_state.parameters):
             normal = market_state.parameters["normal_market"]
             cautious = market_state.parameters["cautious_market"]
             dangerous = market_state.parameters["dangerous_market"]
             
             # Max capital usage should decrease / 最大资金使用比率应该递减
             if not (dangerous.max_capital_usage <= cautious.max_capital_usage <= normal.max_capital_usage):
-                self.errors.append(
-                    "Market state max capital usage should decrease (Normal >= Cautious >= Dangerous)"
-                )
+                self.errors.append(_ERR_CAPITAL_PROGRESSION)
             
             # Max single position should decrease / 单一头寸上限应该递减
             if not (dangerous.max_single_position <= cautious.max_single_position <= normal.max_single_position):
-                self.errors.append(
-                    "Market state max single position should decrease (Normal >= Cautious >= Dangerous)"
-                )
+                self.errors.append(_ERR_POSITION_PROGRESSION)
             
             # Check min cash ratio / 检查现金比例下限
             if cautious.min_cash_ratio and normal.max_capital_usage > (1.0 - cautious.min_cash_ratio):
@@ -153,15 +294,15 @@ class ConstitutionValidator:
         
         # Validate triggers / 验证触发器配置
         if not emergency.triggers:
-            self.errors.append("Emergency rules missing triggers")
+            self.errors.append(_ERR_EMERGENCY_TRIGGERS)
         
         # Validate response plan / 验证应对预案
         if not emergency.response_plan:
-            self.errors.append("Emergency rules missing response plan")
+            self.errors.append(_ERR_EMERGENCY_RESPONSE_PLAN)
         
         # Check if response plan has stages / 检查应对预案是否有阶段性
-        if len(emergency.response_plan) < 2:
-            self.warnings.append("Response plan suggests multiple stages (Warning/Crisis/Extreme)")
+        if len(emergency.response_plan) < _MIN_RESPONSE_STAGES:
+            self.warnings.append(_WARN_RESPONSE_STAGES)
 
     def _validate_execution_discipline(self) -> None:
         """Validate Execution Discipline Configuration / 验证执行纪律配置"""
@@ -169,52 +310,122 @@ class ConstitutionValidator:
         
         # Check best practices / 检查必要的最佳实践
         if not execution.best_practices:
-            self.warnings.append("Execution discipline missing best practices")
+            self.warnings.append(_WARN_BEST_PRACTICES)
         
         # Check price protection / 检查价格保护配置
         if not execution.price_protection:
-            self.warnings.append("Suggest configuring price protection rules")
+            self.warnings.append(_WARN_PRICE_PROTECTION)
 
     def _validate_business_logic(self) -> None:
         """Validate Business Logic Consistency / 验证业务逻辑一致性"""
+        constitution = self._constitution
+        
+        # Check required quality, valuation, checklist and LLM fields / 检查质量、估值、清单及LLM必填字段
+        for get_field, message, is_error in _REQUIRED_FIELD_CHECKS:
+            if not get_field(constitution):
+                (self.errors if is_error else self.warnings).append(message)
+
+    # Validator method name per section, indexed by SectionID; looked up on the
+    # instance so subclass overrides apply / 按SectionID索引的验证方法名（按实例查找，子类覆盖生效）
+    _SECTION_VALIDATORS: Tuple[str, ...] = (
+        "_validate_risk_budget",
+        "_validate_market_states",
+        "_validate_emergency_rules",
+        "_validate_execution_discipline",
+        "_validate_business_logic",
+    )
+
+    # Bitmask (bit = 1 << SectionID) of sections to re-check when a section changes,
+    # indexed by SectionID. Applied in one pass, so list indirect dependents directly;
+    # each check currently reads only its own section
+    # 分区变更时需重新检查的其他分区位掩码（单次展开，间接依赖需直接列出），目前各检查只读取自身分区
+    _SECTION_DEPS: Tuple[int, ...] = (0,) * len(SectionID)
+    _ALL_SECTIONS = (1 << len(SectionID)) - 1
+
+    @staticmethod
+    def _section_bits(section: Union[SectionID, str]) -> int:
+        """
+        Map a changed field or section to a section bitmask / 将变更字段或分区映射为分区位掩码
+        
+        Args:
+            section: Constitution field name (e.g. "quality_standards"), SectionID member
+                or its lowercase name (e.g. "business_logic")
+            
+        Returns:
+            int: Bit of the section checking it, 0 for fields no section checks
+            
+        Raises:
+            ValueError: If the field or section is unknown
+        """
+        if isinstance(section, SectionID):
+            return 1 << section
+        if isinstance(section, str):
+            field_section = _FIELD_SECTIONS.get(section)
+            if field_section is not None:
+                return 1 << field_section
+            if section in Constitution.model_fields:
+                return 0
+            member = SectionID.__members__.get(section.upper())
+            if member is not None:
+                return 1 << member
+        raise ValueError(
+            f"Unknown constitution section: {section}, expected a Constitution field or one of "
+            f"{[member.name.lower() for member in SectionID]} / 未知的宪法分区"
+        )
+
+    def _expand_sections(self, changed_sections: Iterable[Union[SectionID, str]]) -> int:
+        """
+        Expand changed sections with their dependents / 将变更分区扩展为包含其依赖分区
+        
+        Args:
+            changed_sections: Changed fields or sections, see validate()
+            
+        Returns:
+            int: Bitmask of sections to re-check, bit = 1 << SectionID
+            
+        Raises:
+            TypeError: If changed_sections is a single string
+            ValueError: If a field or section is unknown
+        """
+        # A bare str would be iterated per character / 单个字符串会被逐字符迭代
+        if isinstance(changed_sections, str):
+            raise TypeError(
+                f"changed_sections must be a collection, got str {changed_sections!r} / changed_sections必须是集合"
+            )
+        bits = 0
+        for section in changed_sections:
+            bits |= self._section_bits(section)
         
-        # Check quality standards / 检查企业质量标准
-        quality = self.constitution.quality_standards
-        if not quality.business_model:
-            self.errors.append("Quality standards missing business model assessment")
-        if not quality.financial_health:
-            self.errors.append("Quality standards missing financial health assessment")
-        if not quality.management:
-            self.errors.append("Quality standards missing management assessment")
-        
-        # Check valuation principles / 检查估值原则
-        valuation = self.constitution.valuation_principles
-        if not valuation.safety_margin:
-            self.errors.append("Valuation principles missing safety margin configuration")
-        if not valuation.methods:
-            self.errors.append("Valuation principles missing valuation methods")
-        
-        # Check investment checklist / 检查投资检查清单
-        checklist = self.constitution.investment_checklist
-        if not checklist.before_buying:
-            self.errors.append("Investment checklist missing pre-buy questions")
-        if not checklist.during_holding:
-            self.errors.append("Investment checklist missing holding monitoring questions")
-        
-        # Check LLM guidelines / 检查LLM使用规范
-        llm = self.constitution.llm_guidelines
-        if not llm.usage_scope:
-            self.warnings.append("Suggest defining LLM usage scope")
-        if not llm.restrictions:
-            self.warnings.append("Suggest setting LLM restrictions")
-
-    def get_validation_report(self) -> dict:
+        # Add dependents of each changed section / 加入各变更分区的依赖分区
+        deps = self._SECTION_DEPS
+        expanded = bits
+        for section in SectionID:
+            if bits & (1 << section):
+                expanded |= deps[section]
+        return expanded
+
+    def get_validation_report(self, frozen: bool = False) -> Mapping:
         """
         Get Validation Report / 获取验证报告
         
+        Args:
+            frozen: Return a read-only report with tuples instead of copied lists;
+                a clean run returns one shared instance
+            
         Returns:
-            dict: Report containing errors and warnings
+            Mapping: Report containing errors and warnings, a dict unless frozen
         """
+        if frozen:
+            if not self.errors and not self.warnings:
+                return _EMPTY_REPORT
+            return MappingProxyType({
+                "valid": not self.errors,
+                "error_count": len(self.errors),
+                "warning_count": len(self.warnings),
+                "errors": tuple(self.errors),
+                "warnings": tuple(self.warnings),
+            })
+        
         return {
             "valid": len(self.errors) == 0,
             "error_count": len(self.errors),
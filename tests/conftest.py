@@ -2,32 +2,56 @@
 Pytest配置和共享fixtures
 """
 
+import logging
+
 import pytest
+import yaml
 from pathlib import Path
-import sys
 
-# 添加src到Python路径
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from src.app import logging_setup
+from src.constitution.schema import Constitution
+from src.constitution.validator import ConstitutionValidator
 
+# 有效宪法文件内容，导入时读取一次
+_VALID_YAML_TEXT = (Path(__file__).parent / "fixtures" / "valid_constitution.yaml").read_text(encoding="utf-8")
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def fixtures_dir():
     """测试夹具目录"""
     return Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_constitution_path(fixtures_dir):
     """有效的宪法文件路径"""
     return fixtures_dir / "valid_constitution.yaml"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_constitution_path(fixtures_dir):
     """无效的宪法文件路径"""
     return fixtures_dir / "invalid_constitution.yaml"
 
 
+@pytest.fixture(scope="session")
+def valid_constitution_yaml_text():
+    """有效宪法文件的YAML文本"""
+    return _VALID_YAML_TEXT
+
+
+@pytest.fixture(scope="session")
+def loaded_constitution(valid_constitution_yaml_text):
+    """从内存文本解析一次的有效宪法（不可变模型，全会话共享）"""
+    return Constitution(**yaml.safe_load(valid_constitution_yaml_text)["constitution"])
+
+
+@pytest.fixture
+def fresh_validator(loaded_constitution):
+    """包装共享宪法的新验证器"""
+    return ConstitutionValidator(loaded_constitution)
+
+
 @pytest.fixture
 def temp_log_dir(tmp_path):
     """临时日志目录"""
@@ -35,3 +59,18 @@ def temp_log_dir(tmp_path):
     log_dir.mkdir()
     return log_dir
 
+
+@pytest.fixture
+def restore_logging():
+    """还原setup_logging修改的全局日志状态（根处理器、监听线程、审计日志）"""
+    root_logger = logging.getLogger()
+    handlers = root_logger.handlers[:]
+    level = root_logger.level
+    yield
+    if logging_setup._audit_logger is not None:
+        logging_setup._audit_logger.close()
+    logging_setup._audit_logger = None
+    logging_setup._setup_args = None
+    logging_setup._stop_root_listener()
+    root_logger.handlers[:] = handlers
+    root_logger.setLevel(level)
@@ -0,0 +1,94 @@
+"""
+Test Config Loader
+测试配置加载器
+"""
+
+import os
+
+import pytest
+from src.config.loader import ConfigLoader, RuntimeConfig
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    """Remove config environment variables / 清除配置相关环境变量"""
+    for key in ConfigLoader._ENV_KEYS:
+        monkeypatch.delenv(key, raising=False)
+    return monkeypatch
+
+
+class TestConfigLoader:
+    """Config Loader Test / 配置加载器测试"""
+
+    def test_load_defaults(self, clean_env, tmp_path):
+        """Test loading defaults without env file / 测试无环境文件时加载默认配置"""
+        loader = ConfigLoader(tmp_path / ".env")
+        config = loader.load()
+        
+        assert isinstance(config, RuntimeConfig)
+        assert config.system_mode == "SIMULATION"
+        assert config.data_dir is None
+        assert not loader.is_live_mode()
+
+    def test_load_is_cached(self, clean_env, tmp_path):
+        """Test repeated load reuses config / 测试重复加载复用配置"""
+        loader = ConfigLoader(tmp_path / ".env")
+        
+        assert loader.load() is loader.load()
+
+    def test_load_picks_up_env_change(self, clean_env, tmp_path):
+        """Test environment change invalidates cache / 测试环境变量变更使缓存失效"""
+        loader = ConfigLoader(tmp_path / ".env")
+        config1 = loader.load()
+        
+        clean_env.setenv("SYSTEM_MODE", "LIVE")
+        config2 = loader.load()
+        
+        assert config2 is not config1
+        assert config2.system_mode == "LIVE"
+
+    def test_resolved_paths(self, clean_env, tmp_path):
+        """Test paths are resolved on load / 测试加载时解析路径"""
+        clean_env.setenv("LOG_DIR", "relative_logs")
+        config = ConfigLoader(tmp_path / ".env").load()
+        
+        assert config.resolved_log_dir.is_absolute()
+        assert config.resolved_log_dir == config.log_dir.resolve()
+        assert config.resolved_constitution_path.is_absolute()
+
+    def test_resolved_paths_follow_cwd(self, clean_env, tmp_path):
+        """Test cached config is rebuilt after chdir / 测试切换工作目录后重新构建配置"""
+        loader = ConfigLoader(tmp_path / ".env")
+        workdir = tmp_path / "work"
+        workdir.mkdir()
+        config1 = loader.load()
+        
+        clean_env.chdir(workdir)
+        config2 = loader.load()
+        
+        assert config2.resolved_constitution_path == workdir.resolve() / "constitution.yaml"
+        assert config2.resolved_constitution_path != config1.resolved_constitution_path
+
+    def test_env_file_does_not_touch_environ(self, clean_env, tmp_path):
+        """Test .env values are read without mutating os.environ / 测试读取.env时不修改os.environ"""
+        env_file = tmp_path / ".env"
+        env_file.write_text("SYSTEM_MODE=DRY_RUN\nENVIRONMENT=production\n", encoding="utf-8")
+        clean_env.setenv("ENVIRONMENT", "staging")
+        
+        config = ConfigLoader(env_file).load()
+        
+        assert config.system_mode == "DRY_RUN"
+        # Process environment wins over .env / 进程环境变量优先于.env
+        assert config.environment == "staging"
+        assert "SYSTEM_MODE" not in os.environ
+
+    def test_env_file_inject_environ(self, clean_env, tmp_path):
+        """Test inject_environ exports .env values / 测试inject_environ导出.env值"""
+        env_file = tmp_path / ".env"
+        env_file.write_text("SYSTEM_MODE=DRY_RUN\n", encoding="utf-8")
+        
+        try:
+            ConfigLoader(env_file, inject_environ=True).load()
+            assert os.environ["SYSTEM_MODE"] == "DRY_RUN"
+        finally:
+            os.environ.pop("SYSTEM_MODE", None)
@@ -5,7 +5,7 @@ Test Constitution Loader
 
 import pytest
 from pathlib import Path
-from src.constitution.loader import ConstitutionLoader, ConstitutionLoadError
+from src.constitution.loader import ConstitutionLoader, ConstitutionLoadError, LazyConstitution
 from src.constitution.schema import Constitution
 
 
@@ -67,6 +67,37 @@ class TestConstitutionLoader:
         assert len(triggers) > 0
         # assert "description" in triggers[0] # Triggers are now just strings in the new schema
 
+    def test_model_copy_recomputes_derived_values(self, valid_constitution_path):
+        """Test model_copy does not keep stale cached values / 测试model_copy不保留过期的缓存值"""
+        constitution = ConstitutionLoader(valid_constitution_path).load()
+        constitution.get_risk_limits()
+        constitution.get_emergency_triggers()
+        
+        risk = constitution.risk_budget.model_copy(update={"max_drawdown": 0.5})
+        emergency = constitution.emergency_rules.model_copy(update={"triggers": ["New trigger"]})
+        copied = constitution.model_copy(update={"risk_budget": risk, "emergency_rules": emergency})
+        
+        assert copied.get_risk_limits()["max_drawdown"] == 0.5
+        assert copied.get_emergency_triggers() == ["New trigger"]
+        assert constitution.get_risk_limits()["max_drawdown"] != 0.5
+        # The name list is class-level, not a per-instance private attribute / 名称列表属于类，而非实例私有属性
+        assert "_CACHED_PROPERTIES" not in Constitution.__private_attributes__
+
+    def test_market_state_parameters_follow_model_copy(self, valid_constitution_path):
+        """Test parameter lookup reflects model_copy updates / 测试参数查询反映model_copy的更新"""
+        constitution = ConstitutionLoader(valid_constitution_path).load()
+        market_state = constitution.market_state
+        
+        parameters = dict(market_state.parameters)
+        parameters["dangerous_market"] = parameters["dangerous_market"].model_copy(
+            update={"max_single_position": 0.2}
+        )
+        copied = constitution.model_copy(
+            update={"market_state": market_state.model_copy(update={"parameters": parameters})}
+        )
+        
+        assert copied.get_market_state_parameters("dangerous_market").max_single_position == 0.2
+
     def test_constitution_property_before_load(self):
         """Test accessing constitution property before load / 测试在加载前访问constitution属性"""
         loader = ConstitutionLoader(Path("dummy.yaml"))
@@ -84,3 +115,97 @@ class TestConstitutionLoader:
         
         assert isinstance(constitution2, Constitution)
         assert constitution1.meta_info.title == constitution2.meta_info.title
+
+    def test_load_uses_json_cache(self, valid_constitution_path, tmp_path):
+        """Test JSON sidecar cache / 测试JSON缓存"""
+        path = tmp_path / "constitution.yaml"
+        path.write_text(valid_constitution_path.read_text(encoding="utf-8"), encoding="utf-8")
+        
+        loader = ConstitutionLoader(path, use_cache=True)
+        constitution1 = loader.load()
+        assert loader.cache_path.exists()
+        
+        # Same permissions as a normally created file / 权限与普通创建的文件一致
+        plain = tmp_path / "plain.json"
+        plain.touch()
+        assert loader.cache_path.stat().st_mode == plain.stat().st_mode
+        
+        # Second load is served from cache / 第二次加载命中缓存
+        constitution2 = ConstitutionLoader(path, use_cache=True).load()
+        assert constitution2 == constitution1
+
+    def test_cache_invalidated_on_change(self, valid_constitution_path, tmp_path):
+        """Test cache invalidation when file changes / 测试文件变更时缓存失效"""
+        path = tmp_path / "constitution.yaml"
+        text = valid_constitution_path.read_text(encoding="utf-8")
+        path.write_text(text, encoding="utf-8")
+        ConstitutionLoader(path, use_cache=True).load()
+        
+        path.write_text(text.replace("Test Constitution", "Changed Constitution"), encoding="utf-8")
+        constitution = ConstitutionLoader(path, use_cache=True).load()
+        
+        assert constitution.meta_info.title == "Changed Constitution"
+
+    def test_reload_unchanged_reuses_constitution(self, valid_constitution_path):
+        """Test reload of unchanged file reuses object / 测试未变更文件重新加载复用对象"""
+        loader = ConstitutionLoader(valid_constitution_path)
+        constitution1 = loader.load()
+        
+        assert loader.reload() is constitution1
+        assert loader.reload(force=True) is not constitution1
+
+    def test_lazy_load(self, valid_constitution_path):
+        """Test lazy loading builds sections on access / 测试惰性加载按需构建章节"""
+        loader = ConstitutionLoader(valid_constitution_path, lazy=True)
+        constitution = loader.load()
+        
+        assert isinstance(constitution, LazyConstitution)
+        assert "risk_budget" not in vars(constitution)
+        
+        risk_limits = loader.get_risk_limits()
+        assert "risk_budget" in vars(constitution)
+        assert "quality_standards" not in vars(constitution)
+        assert risk_limits == ConstitutionLoader(valid_constitution_path).load().get_risk_limits()
+        
+        assert loader.get_market_state_parameters("normal_market")["max_capital_usage"] == 0.90
+        assert len(loader.get_emergency_triggers()) > 0
+        assert isinstance(constitution.materialize(), Constitution)
+
+    def test_cache_off_by_default(self, valid_constitution_path, tmp_path):
+        """Test no sidecar is written unless use_cache is set / 测试未启用use_cache时不写缓存文件"""
+        path = tmp_path / "constitution.yaml"
+        path.write_text(valid_constitution_path.read_text(encoding="utf-8"), encoding="utf-8")
+        
+        loader = ConstitutionLoader(path)
+        loader.load()
+        assert not loader.cache_path.exists()
+
+    def test_invalid_data_not_cached(self, invalid_constitution_path, tmp_path):
+        """Test data failing validation is not cached / 测试未通过验证的数据不被缓存"""
+        path = tmp_path / "constitution.yaml"
+        path.write_text(invalid_constitution_path.read_text(encoding="utf-8"), encoding="utf-8")
+        
+        loader = ConstitutionLoader(path, use_cache=True)
+        with pytest.raises(ConstitutionLoadError):
+            loader.load()
+        assert not loader.cache_path.exists()
+
+    def test_non_str_keys_not_cached(self, valid_constitution_path, tmp_path):
+        """Test data that JSON cannot round-trip is not cached / 测试无法经JSON往返的数据不被缓存"""
+        path = tmp_path / "constitution.yaml"
+        text = valid_constitution_path.read_text(encoding="utf-8")
+        path.write_text(
+            text.replace('      normal_market: "Shiller PE < 25"\n', '      normal_market: "Shiller PE < 25"\n      1: numeric key\n'),
+            encoding="utf-8",
+        )
+        
+        # Fails the same way with or without a cache file / 有无缓存文件都同样失败
+        for _ in range(2):
+            loader = ConstitutionLoader(path, use_cache=True)
+            with pytest.raises(ConstitutionLoadError):
+                loader.load()
+            assert not loader.cache_path.exists()
+        
+        # Round-trip check alone also refuses such data / 仅往返检查也会拒绝此类数据
+        loader._write_cache({"mtime_ns": 0, "size": 0}, {"constitution": {1: "numeric key"}})
+        assert not loader.cache_path.exists()
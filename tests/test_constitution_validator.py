@@ -5,18 +5,15 @@ Test Constitution Validator
 
 import pytest
 from src.constitution.loader import ConstitutionLoader
-from src.constitution.validator import ConstitutionValidator, ValidationError
+from src.constitution.validator import ConstitutionValidator, SectionID, ValidationError
 
 
 class TestConstitutionValidator:
     """Constitution Validator Test / 宪法验证器测试"""
 
-    def test_validate_valid_constitution(self, valid_constitution_path):
+    def test_validate_valid_constitution(self, fresh_validator):
         """Test validating valid constitution / 测试验证有效的宪法"""
-        loader = ConstitutionLoader(valid_constitution_path)
-        constitution = loader.load()
-        
-        validator = ConstitutionValidator(constitution)
+        validator = fresh_validator
         result = validator.validate(strict=False)
         
         assert result is True
@@ -29,12 +26,9 @@ class TestConstitutionValidator:
         with pytest.raises(Exception):
             constitution = loader.load()
 
-    def test_validation_report(self, valid_constitution_path):
+    def test_validation_report(self, fresh_validator):
         """Test getting validation report / 测试获取验证报告"""
-        loader = ConstitutionLoader(valid_constitution_path)
-        constitution = loader.load()
-        
-        validator = ConstitutionValidator(constitution)
+        validator = fresh_validator
         validator.validate(strict=False)
         
         report = validator.get_validation_report()
@@ -47,46 +41,48 @@ class TestConstitutionValidator:
         assert isinstance(report["errors"], list)
         assert isinstance(report["warnings"], list)
 
-    def test_risk_budget_validation(self, valid_constitution_path):
-        """Test risk budget validation / 测试风险预算验证"""
-        loader = ConstitutionLoader(valid_constitution_path)
-        constitution = loader.load()
+    def test_frozen_validation_report(self, fresh_validator):
+        """Test read-only validation report / 测试只读验证报告"""
+        validator = fresh_validator
         
-        validator = ConstitutionValidator(constitution)
+        # Nothing found yet, shared empty report / 尚无结果，返回共享空报告
+        assert validator.get_validation_report(frozen=True) is validator.get_validation_report(frozen=True)
+        
+        validator.validate(strict=False)
+        report = validator.get_validation_report(frozen=True)
+        
+        assert report == {**validator.get_validation_report(), "errors": tuple(validator.errors), "warnings": tuple(validator.warnings)}
+        with pytest.raises(TypeError):
+            report["valid"] = False
+
+    def test_risk_budget_validation(self, fresh_validator):
+        """Test risk budget validation / 测试风险预算验证"""
+        validator = fresh_validator
         validator._validate_risk_budget()
         
         # Valid config should have no errors / 有效配置不应有错误
         assert len(validator.errors) == 0
 
-    def test_market_states_validation(self, valid_constitution_path):
+    def test_market_states_validation(self, fresh_validator):
         """Test market states validation / 测试市场状态验证"""
-        loader = ConstitutionLoader(valid_constitution_path)
-        constitution = loader.load()
-        
-        validator = ConstitutionValidator(constitution)
+        validator = fresh_validator
         validator._validate_market_states()
         
         # Check for market state errors / 检查是否有市场状态相关的错误
         # Valid config might have warnings but no errors / 有效配置可能有警告但不应有严重错误
         assert all("normal_market" not in error for error in validator.errors) or len(validator.errors) == 0
 
-    def test_emergency_rules_validation(self, valid_constitution_path):
+    def test_emergency_rules_validation(self, fresh_validator):
         """Test emergency rules validation / 测试紧急规则验证"""
-        loader = ConstitutionLoader(valid_constitution_path)
-        constitution = loader.load()
-        
-        validator = ConstitutionValidator(constitution)
+        validator = fresh_validator
         validator._validate_emergency_rules()
         
         # Valid config should have emergency rules / 有效配置应该有紧急规则
         assert len(validator.errors) == 0
 
-    def test_strict_mode_validation(self, valid_constitution_path):
+    def test_strict_mode_validation(self, fresh_validator):
         """Test strict mode validation / 测试严格模式验证"""
-        loader = ConstitutionLoader(valid_constitution_path)
-        constitution = loader.load()
-        
-        validator = ConstitutionValidator(constitution)
+        validator = fresh_validator
         
         # Non-strict mode: pass with warnings / 非严格模式：有警告也通过
         result = validator.validate(strict=False)
@@ -96,5 +92,152 @@ class TestConstitutionValidator:
             # If warnings exist, should fail in strict mode / 如果有警告，在严格模式下应该失败
             result_strict = validator.validate(strict=True)
             assert result_strict is False
+            # Same decision from existing findings / 基于已有结果得出相同判定
+            assert validator._decide(strict=True) is False
+            assert validator._decide(strict=False) is result
         else:
             assert result is True
+
+    def test_partial_validation(self, loaded_constitution, fresh_validator):
+        """Test re-validating only changed sections / 测试仅重新验证变更分区"""
+        constitution = loaded_constitution
+        validator = fresh_validator
+        validator.validate(strict=False)
+        warning_count = len(validator.warnings)
+        
+        execution = constitution.execution_discipline.model_copy(update={"best_practices": []})
+        validator.constitution = constitution.model_copy(update={"execution_discipline": execution})
+        validator.validate(strict=False, changed_sections={"execution_discipline"})
+        
+        assert "Execution discipline missing best practices" in validator.warnings
+        assert len(validator.warnings) == warning_count + 1
+        
+        # SectionID members are accepted as well / 也接受SectionID成员
+        validator.validate(strict=False, changed_sections={SectionID.EXECUTION_DISCIPLINE})
+        assert len(validator.warnings) == warning_count + 1
+        
+        with pytest.raises(ValueError):
+            validator.validate(strict=False, changed_sections={"unknown_section"})
+        with pytest.raises(TypeError):
+            validator.validate(strict=False, changed_sections="execution_discipline")
+
+    def test_partial_validation_by_field_name(self, loaded_constitution, fresh_validator):
+        """Test constitution field names select their section / 测试宪法字段名映射到对应分区"""
+        constitution = loaded_constitution
+        validator = fresh_validator
+        validator.validate(strict=False)
+        
+        quality = constitution.quality_standards.model_copy(update={"management": []})
+        validator.constitution = constitution.model_copy(update={"quality_standards": quality})
+        validator.validate(strict=False, changed_sections={"quality_standards"})
+        
+        assert "Quality standards missing management assessment" in validator.errors
+        
+        for field in ("valuation_principles", "investment_checklist", "llm_guidelines", "meta_info"):
+            validator.validate(strict=False, changed_sections={field})
+
+    def test_validation_result_cached(self, loaded_constitution, monkeypatch):
+        """Test repeat validation reuses cached result / 测试重复验证复用缓存结果"""
+        constitution = loaded_constitution
+        
+        calls = []
+        validate_risk_budget = ConstitutionValidator._validate_risk_budget
+        monkeypatch.setattr(
+            ConstitutionValidator,
+            "_validate_risk_budget",
+            lambda validator: calls.append(1) or validate_risk_budget(validator),
+        )
+        
+        validator = ConstitutionValidator(constitution)
+        first = validator.validate(strict=False)
+        second = validator.validate(strict=False)
+        assert first == second
+        assert len(calls) == 1
+        
+        # Reassigning the constitution invalidates the cache / 重新赋值宪法会使缓存失效
+        validator.constitution = constitution
+        validator.validate(strict=False)
+        assert len(calls) == 2
+
+    def test_invalidate_cache_after_in_place_mutation(self, loaded_constitution):
+        """Test invalidate_cache picks up nested in-place changes / 测试invalidate_cache能反映嵌套的原地修改"""
+        constitution = loaded_constitution.model_copy(deep=True)
+        validator = ConstitutionValidator(constitution)
+        assert validator.validate(strict=False)
+        
+        # Frozen models still allow mutating nested dicts / 冻结模型仍允许修改嵌套字典
+        constitution.market_state.parameters.pop("dangerous_market")
+        validator.invalidate_cache()
+        assert not validator.validate(strict=False)
+
+    def test_market_state_progression_checked_per_parameter(self, loaded_constitution):
+        """Test each parameter must decrease on its own / 测试每个参数各自必须递减"""
+        constitution = loaded_constitution
+        market_state = constitution.market_state
+        
+        # Capital usage still decreases, single position does not / 资金使用率仍递减，单一头寸不递减
+        parameters = dict(market_state.parameters)
+        parameters["dangerous_market"] = parameters["dangerous_market"].model_copy(
+            update={"max_single_position": 0.20}
+        )
+        validator = ConstitutionValidator(
+            constitution.model_copy(update={"market_state": market_state.model_copy(update={"parameters": parameters})})
+        )
+        validator._validate_market_states()
+        
+        assert validator.errors == [
+            "Market state max single position should decrease (Normal >= Cautious >= Dangerous)"
+        ]
+
+    def test_business_logic_required_fields(self, loaded_constitution):
+        """Test empty required fields are reported / 测试空的必填字段会被报告"""
+        constitution = loaded_constitution
+        
+        quality = constitution.quality_standards.model_copy(update={"business_model": []})
+        llm = constitution.llm_guidelines.model_copy(update={"usage_scope": []})
+        validator = ConstitutionValidator(
+            constitution.model_copy(update={"quality_standards": quality, "llm_guidelines": llm})
+        )
+        validator._validate_business_logic()
+        
+        assert validator.errors == ["Quality standards missing business model assessment"]
+        assert validator.warnings == ["Suggest defining LLM usage scope"]
+
+    def test_all_sections_checked_despite_missing_fields(self, loaded_constitution):
+        """Test missing fields do not hide risk limit errors / 测试缺失字段不会掩盖风险限额错误"""
+        constitution = loaded_constitution
+        
+        emergency = constitution.emergency_rules.model_copy(update={"response_plan": {}})
+        risk = constitution.risk_budget.model_copy(update={"max_single_position": 0.99})
+        validator = ConstitutionValidator(
+            constitution.model_copy(update={"emergency_rules": emergency, "risk_budget": risk})
+        )
+        
+        assert validator.validate(strict=False) is False
+        # Risk budget errors come first, then emergency rules / 风险预算错误在前，其后为紧急规则
+        assert validator.errors[0].startswith("Max single position (0.99) cannot exceed max capital usage")
+        assert validator.errors[-1] == "Emergency rules missing response plan"
+        assert any(warning.startswith("Max single position too high") for warning in validator.warnings)
+
+    def test_subclass_section_override_used(self, loaded_constitution):
+        """Test subclass overrides of section validators run / 测试子类覆盖的分区验证方法会被执行"""
+        class StrictValidator(ConstitutionValidator):
+            def _validate_risk_budget(self) -> None:
+                self.errors.append("Custom risk check failed")
+        
+        validator = StrictValidator(loaded_constitution)
+        
+        assert validator.validate(strict=False) is False
+        assert validator.errors == ["Custom risk check failed"]
+
+    def test_section_dependents_added(self, fresh_validator, monkeypatch):
+        """Test changed sections include their dependents / 测试变更分区包含其依赖分区"""
+        assert fresh_validator._expand_sections({"business_logic"}) == 1 << SectionID.BUSINESS_LOGIC
+        
+        deps = [0] * len(SectionID)
+        deps[SectionID.BUSINESS_LOGIC] = 1 << SectionID.RISK_BUDGET
+        monkeypatch.setattr(ConstitutionValidator, "_SECTION_DEPS", tuple(deps))
+        
+        bits = fresh_validator._expand_sections({"business_logic"})
+        
+        assert bits == (1 << SectionID.BUSINESS_LOGIC) | (1 << SectionID.RISK_BUDGET)
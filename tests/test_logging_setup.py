@@ -0,0 +1,94 @@
+"""
+Test Logging Setup
+测试日志系统配置
+"""
+
+import json
+import pytest
+from src.app.logging_setup import AuditLogger, AuditEventType, setup_logging
+
+
+class TestLoggingSetup:
+    """Logging Setup Test / 日志系统配置测试"""
+
+    def test_setup_logging_idempotent(self, temp_log_dir, restore_logging):
+        """Test repeated logging setup reuses audit logger / 测试重复配置日志复用审计日志记录器"""
+        audit_logger1 = setup_logging(log_dir=temp_log_dir, enable_console=False)
+        audit_logger2 = setup_logging(log_dir=temp_log_dir, enable_console=False)
+        
+        assert audit_logger1 is audit_logger2
+
+
+class TestAuditLogger:
+    """Audit Logger Test / 审计日志记录器测试"""
+
+    def test_default_mode_blocking(self, temp_log_dir):
+        """Test events are written before log_event returns by default / 测试默认在log_event返回前写入"""
+        audit_logger = AuditLogger(temp_log_dir)
+        try:
+            assert audit_logger.mode == "blocking"
+            audit_logger.log_event(AuditEventType.SYSTEM_STARTED, "Started")
+            
+            assert audit_logger.audit_file.read_text(encoding="utf-8").count("\n") == 1
+        finally:
+            audit_logger.close()
+
+    @pytest.mark.parametrize("mode", ["batch", "blocking"])
+    def test_audit_logger_writes_events(self, temp_log_dir, mode):
+        """Test audit events reach the file / 测试审计事件写入文件"""
+        audit_logger = AuditLogger(temp_log_dir, mode=mode, batch_max_wait=60.0)
+        try:
+            for i in range(3):
+                audit_logger.log_event(AuditEventType.MODE_SWITCHED, f"Event {i}")
+            audit_logger.flush()
+            
+            lines = audit_logger.audit_file.read_text(encoding="utf-8").splitlines()
+            assert len(lines) == 3
+        finally:
+            audit_logger.close()
+
+    @pytest.mark.parametrize("mode", ["batch", "blocking"])
+    def test_audit_unserializable_event_skipped(self, temp_log_dir, mode, capsys):
+        """Test one unserializable event does not drop others / 测试单条无法序列化的事件不影响其他事件"""
+        audit_logger = AuditLogger(temp_log_dir, mode=mode, batch_max_wait=60.0)
+        try:
+            audit_logger.log_event(AuditEventType.MODE_SWITCHED, "Good 1")
+            audit_logger.log_event(AuditEventType.MODE_SWITCHED, "Bad", details={"path": temp_log_dir})
+            audit_logger.log_event(AuditEventType.MODE_SWITCHED, "Good 2")
+            audit_logger.flush()
+            
+            lines = audit_logger.audit_file.read_text(encoding="utf-8").splitlines()
+            assert len(lines) == 2
+            assert "--- Logging error ---" in capsys.readouterr().err
+        finally:
+            audit_logger.close()
+
+    def test_audit_non_str_keys_written(self, temp_log_dir):
+        """Test details with non-str keys are still written / 测试含非字符串键的详情仍被写入"""
+        audit_logger = AuditLogger(temp_log_dir, mode="blocking")
+        try:
+            audit_logger.log_event(AuditEventType.MODE_SWITCHED, "Keys", details={1: "a"})
+            audit_logger.flush()
+            
+            lines = audit_logger.audit_file.read_text(encoding="utf-8").splitlines()
+            assert len(lines) == 1
+            assert json.loads(lines[0])["extra"]["details"] == {"1": "a"}
+            # Same compact layout as orjson output / 与orjson输出同样紧凑
+            assert '"details":{"1":"a"}' in lines[0]
+        finally:
+            audit_logger.close()
+
+    def test_audit_snapshot_at_log_time(self, temp_log_dir):
+        """Test batched events are unaffected by later details edits / 测试批量事件不受之后修改详情的影响"""
+        audit_logger = AuditLogger(temp_log_dir, mode="batch", batch_max_wait=60.0)
+        try:
+            details = {"reason": "real reason"}
+            audit_logger.log_event(AuditEventType.MODE_SWITCHED, "Switched", details=details)
+            details["reason"] = "TAMPERED"
+            audit_logger.flush()
+            
+            content = audit_logger.audit_file.read_text(encoding="utf-8")
+            assert "real reason" in content
+            assert "TAMPERED" not in content
+        finally:
+            audit_logger.close()
@@ -5,7 +5,7 @@ Test Mode Manager
 
 import pytest
 from src.app.mode_manager import ModeManager, SystemMode, ModeTransitionError
-from src.app.logging_setup import setup_logging
+from src.app.logging_setup import AuditLogger, AuditEventType, setup_logging
 
 
 class TestModeManager:
@@ -17,7 +17,7 @@ class TestModeManager:
         assert manager.current_mode == SystemMode.SIMULATION
         assert manager.is_simulation()
 
-    def test_allowed_transition(self, temp_log_dir):
+    def test_allowed_transition(self, temp_log_dir, restore_logging):
         """Test allowed transition / 测试允许的状态转换"""
         audit_logger = setup_logging(log_dir=temp_log_dir, enable_console=False)
         manager = ModeManager(
@@ -60,7 +60,7 @@ class TestModeManager:
         assert result is True
         assert manager.is_live()
 
-    def test_emergency_trigger(self, temp_log_dir):
+    def test_emergency_trigger(self, temp_log_dir, restore_logging):
         """Test emergency trigger / 测试紧急模式触发"""
         audit_logger = setup_logging(log_dir=temp_log_dir, enable_console=False)
         manager = ModeManager(
@@ -91,6 +91,9 @@ class TestModeManager:
         last_record = history[-1]
         assert last_record["old_mode"] == SystemMode.SIMULATION.value
         assert last_record["new_mode"] == SystemMode.DRY_RUN.value
+        # History holds plain strings, not enum members / 历史记录保存纯字符串而非枚举成员
+        assert type(last_record["old_mode"]) is str
+        assert type(last_record["new_mode"]) is str
         assert "timestamp" in last_record
         assert "reason" in last_record
 
@@ -155,3 +158,53 @@ class TestModeManager:
         
         repr_str = repr(manager)
         assert "ModeManager" in repr_str
+
+    def test_transition_table_matches_rules(self):
+        """Test adjacency matrix agrees with ALLOWED_TRANSITIONS / 测试邻接矩阵与转换规则一致"""
+        for source in SystemMode:
+            for target in SystemMode:
+                index = ModeManager._ORD[source] * len(SystemMode) + ModeManager._ORD[target]
+                assert bool(ModeManager._TABLE[index]) == (target in ModeManager.ALLOWED_TRANSITIONS[source])
+
+    def test_mode_history_bounded(self):
+        """Test mode history is bounded / 测试模式历史记录有上限"""
+        manager = ModeManager(initial_mode=SystemMode.SIMULATION, history_maxlen=2)
+        
+        manager.switch_mode(SystemMode.DRY_RUN, "Test")
+        manager.switch_mode(SystemMode.SIMULATION, "Test")
+        
+        history = manager.get_mode_history()
+        assert len(history) == 2
+        assert history[0]["new_mode"] == SystemMode.DRY_RUN.value
+        assert list(manager.iter_mode_history()) == list(history)
+
+    def test_switch_audit_details_not_history_record(self):
+        """Test audit details are a copy of the history record / 测试审计详情是历史记录的副本"""
+        events = []
+        
+        class _RecordingAuditLogger:
+            def log_event(self, event_type, message, details=None, user=None):
+                events.append((event_type, details))
+        
+        manager = ModeManager(audit_logger=_RecordingAuditLogger())
+        manager.switch_mode(SystemMode.DRY_RUN, "Test")
+        
+        record = manager.get_mode_history()[-1]
+        event_type, details = events[-1]
+        assert event_type == AuditEventType.MODE_SWITCHED
+        assert details == record
+        assert details is not record
+
+    def test_denied_switch_audited(self, temp_log_dir):
+        """Test denied switch writes an audit event / 测试被拒绝的切换写入审计事件"""
+        audit_logger = AuditLogger(temp_log_dir, mode="blocking")
+        try:
+            manager = ModeManager(audit_logger=audit_logger)
+            with pytest.raises(ModeTransitionError):
+                manager.switch_mode(SystemMode.LIVE, "Test")
+            audit_logger.flush()
+            
+            content = audit_logger.audit_file.read_text(encoding="utf-8")
+            assert AuditEventType.MODE_SWITCH_DENIED in content
+        finally:
+            audit_logger.close()